@@ -49,8 +49,16 @@ def version_callback(value: bool) -> None:
         raise typer.Exit()
 
 
-def setup_logging(verbose: bool = False, quiet: bool = False) -> None:
-    """Setup logging configuration."""
+def setup_logging(verbose: bool = False, quiet: bool = False) -> str:
+    """Setup logging configuration.
+
+    Args:
+        verbose: Enable debug output
+        quiet: Only show warnings and errors
+
+    Returns:
+        Name of the log level applied to the stderr handler
+    """
     logger.remove()  # Remove default handler
 
     if quiet:
@@ -64,6 +72,7 @@ def setup_logging(verbose: bool = False, quiet: bool = False) -> None:
         format_str = "<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>"
 
     logger.add(sys.stderr, level=level, format=format_str, colorize=True)
+    return level
 
 
 def get_global_options(ctx: typer.Context) -> tuple[bool, bool]:
@@ -115,6 +124,86 @@ def _load_coldpack_metadata(
     return None, None
 
 
+def _validate_memory_limit(memory_limit: str) -> None:
+    """Validate a --memory-limit value such as '1g', '512m', '256k' or '1024'.
+
+    Args:
+        memory_limit: Memory limit string given on the command line
+
+    Raises:
+        typer.Exit: If the format is invalid or the limit is out of range
+    """
+    import re
+
+    pattern = r"^(\d+)([kmg]?)$"
+    match = re.match(pattern, memory_limit.lower())
+
+    if not match:
+        console.print(
+            "[red]Error: --memory-limit must be in format like '1g', '512m', '256k', or '1024' (for bytes)[/red]"
+        )
+        raise typer.Exit(ExitCodes.INVALID_FORMAT)
+
+    number_str, unit = match.groups()
+    number = int(number_str)
+
+    if number <= 0:
+        console.print("[red]Error: --memory-limit must be a positive number[/red]")
+        raise typer.Exit(ExitCodes.INVALID_FORMAT)
+
+    # Validate reasonable limits
+    if unit == "g" and number > 64:
+        console.print("[red]Error: --memory-limit cannot exceed 64GB[/red]")
+        raise typer.Exit(ExitCodes.INVALID_FORMAT)
+    elif unit == "m" and number > 65536:
+        console.print("[red]Error: --memory-limit cannot exceed 65536MB[/red]")
+        raise typer.Exit(ExitCodes.INVALID_FORMAT)
+    elif unit == "k" and number > 67108864:
+        console.print("[red]Error: --memory-limit cannot exceed 67108864KB[/red]")
+        raise typer.Exit(ExitCodes.INVALID_FORMAT)
+    elif unit == "" and number > 68719476736:
+        console.print(
+            "[red]Error: --memory-limit cannot exceed 68719476736 bytes (64GB)[/red]"
+        )
+        raise typer.Exit(ExitCodes.INVALID_FORMAT)
+
+
+def _validate_verify_flags(
+    no_verify: bool,
+    no_verify_7z: bool,
+    no_verify_sha256: bool,
+    no_verify_blake3: bool,
+    no_verify_par2: bool,
+) -> None:
+    """Reject --no-verify combined with any individual --no-verify-* option.
+
+    Args:
+        no_verify: Skip all verification
+        no_verify_7z: Skip 7z integrity verification
+        no_verify_sha256: Skip SHA-256 hash verification
+        no_verify_blake3: Skip BLAKE3 hash verification
+        no_verify_par2: Skip PAR2 recovery verification
+
+    Raises:
+        typer.Exit: If the options conflict
+    """
+    if no_verify and any(
+        [
+            no_verify_7z,
+            no_verify_sha256,
+            no_verify_blake3,
+            no_verify_par2,
+        ]
+    ):
+        console.print(
+            "[red]Error: --no-verify cannot be used with individual --no-verify-* options[/red]"
+        )
+        console.print(
+            "[yellow]Use either --no-verify to skip all verification, or specific --no-verify-* options[/yellow]"
+        )
+        raise typer.Exit(1)
+
+
 @app.callback()
 def main(
     ctx: typer.Context,
@@ -313,56 +402,12 @@ def create(
 
     # Validate memory_limit parameter
     if memory_limit is not None:
-        import re
-
-        pattern = r"^(\d+)([kmg]?)$"
-        match = re.match(pattern, memory_limit.lower())
-
-        if not match:
-            console.print(
-                "[red]Error: --memory-limit must be in format like '1g', '512m', '256k', or '1024' (for bytes)[/red]"
-            )
-            raise typer.Exit(ExitCodes.INVALID_FORMAT)
-
-        number_str, unit = match.groups()
-        number = int(number_str)
-
-        if number <= 0:
-            console.print("[red]Error: --memory-limit must be a positive number[/red]")
-            raise typer.Exit(ExitCodes.INVALID_FORMAT)
-
-        # Validate reasonable limits
-        if unit == "g" and number > 64:
-            console.print("[red]Error: --memory-limit cannot exceed 64GB[/red]")
-            raise typer.Exit(ExitCodes.INVALID_FORMAT)
-        elif unit == "m" and number > 65536:
-            console.print("[red]Error: --memory-limit cannot exceed 65536MB[/red]")
-            raise typer.Exit(ExitCodes.INVALID_FORMAT)
-        elif unit == "k" and number > 67108864:
-            console.print("[red]Error: --memory-limit cannot exceed 67108864KB[/red]")
-            raise typer.Exit(ExitCodes.INVALID_FORMAT)
-        elif unit == "" and number > 68719476736:
-            console.print(
-                "[red]Error: --memory-limit cannot exceed 68719476736 bytes (64GB)[/red]"
-            )
-            raise typer.Exit(ExitCodes.INVALID_FORMAT)
+        _validate_memory_limit(memory_limit)
 
     # Validate verification parameters
-    if no_verify and any(
-        [
-            no_verify_7z,
-            no_verify_sha256,
-            no_verify_blake3,
-            no_verify_par2,
-        ]
-    ):
-        console.print(
-            "[red]Error: --no-verify cannot be used with individual --no-verify-* options[/red]"
-        )
-        console.print(
-            "[yellow]Use either --no-verify to skip all verification, or specific --no-verify-* options[/yellow]"
-        )
-        raise typer.Exit(1)
+    _validate_verify_flags(
+        no_verify, no_verify_7z, no_verify_sha256, no_verify_blake3, no_verify_par2
+    )
 
     # Validate source
     if not source.exists():
@@ -1508,6 +1553,12 @@ def display_par2_info(par2_path: Path) -> None:
         par2_table.add_column("Value", style="green")
 
         par2_table.add_row("Path", str(par2_path))
+        par2_table.add_row(
+            "PAR2 Tool",
+            "par2cmdline-turbo"
+            if par2_manager.is_turbo
+            else "par2cmdline (par2cmdline-turbo is faster)",
+        )
         par2_table.add_row("Redundancy", f"{info['redundancy_percent']}%")
         par2_table.add_row("Recovery Files", str(info["file_count"]))
         par2_table.add_row("Total Size", format_file_size(info["total_size"]))
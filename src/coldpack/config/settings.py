@@ -92,6 +92,9 @@ class SevenZipSettings(BaseModel):
     @classmethod
     def validate_method(cls, v: str) -> str:
         """Validate compression method."""
+        # Reason: py7zz drives the upstream 7-Zip binary, which has neither the
+        # Fast-LZMA2 (FLZMA2) nor the Zstandard (ZSTD) codec; those only exist
+        # in the 7-Zip-zstd fork, so offering them would fail at runtime
         valid_methods = {"LZMA2", "LZMA", "PPMd", "BZip2"}
         if v not in valid_methods:
             raise ValueError(f"Compression method must be one of: {valid_methods}")
@@ -396,28 +396,12 @@ class ColdStorageArchiver:
             logger.debug(f"Content extracted to: {extracted_dir}")
             return extracted_dir
 
-    def _create_7z_archive(
-        self, source_dir: Path, archive_dir: Path, archive_name: str, safe_ops: Any
-    ) -> Path:
-        """Create 7z archive using SevenZipCompressor directly in final location.
+    def _resolve_sevenzip_settings(self, source_size: int) -> None:
+        """Apply size-based 7z optimization unless settings are manual.
 
         Args:
-            source_dir: Directory to archive
-            archive_dir: Final archive directory where 7z file will be created
-            archive_name: Archive name
-            safe_ops: Safe file operations context
-
-        Returns:
-            Path to created 7z archive
+            source_size: Total size of the source content in bytes
         """
-        logger.info("Step 2: Creating 7z archive with dynamic optimization")
-
-        # Calculate source directory size for optimization
-        source_size = sum(
-            f.stat().st_size for f in source_dir.rglob("*") if f.is_file()
-        )
-        logger.info(f"Source content size: {format_file_size(source_size)}")
-
         # Check if settings are manually configured
         if self.sevenzip_settings.manual_settings:
             # Use manual settings without optimization
@@ -445,6 +429,30 @@ class ColdStorageArchiver:
             self.sevenzip_compressor = SevenZipCompressor(optimized_settings)
             self.sevenzip_settings = optimized_settings
 
+    def _create_7z_archive(
+        self, source_dir: Path, archive_dir: Path, archive_name: str, safe_ops: Any
+    ) -> Path:
+        """Create 7z archive using SevenZipCompressor directly in final location.
+
+        Args:
+            source_dir: Directory to archive
+            archive_dir: Final archive directory where 7z file will be created
+            archive_name: Archive name
+            safe_ops: Safe file operations context
+
+        Returns:
+            Path to created 7z archive
+        """
+        logger.info("Step 2: Creating 7z archive with dynamic optimization")
+
+        # Calculate source directory size for optimization
+        source_size = sum(
+            f.stat().st_size for f in source_dir.rglob("*") if f.is_file()
+        )
+        logger.info(f"Source content size: {format_file_size(source_size)}")
+
+        self._resolve_sevenzip_settings(source_size)
+
         # Create 7z archive path directly in final location
         archive_path = archive_dir / f"{archive_name}.7z"
 
@@ -5,6 +5,9 @@
 
 import os
 import shutil
+import stat
+import threading
+import time
 from collections.abc import Generator
 from contextlib import contextmanager
 from pathlib import Path
@@ -33,11 +36,56 @@ class PermissionError(FilesystemError):
     pass
 
 
+# Short-lived cache of shutil.disk_usage results keyed by absolute path
+DISK_USAGE_CACHE_TTL = 1.0  # seconds
+_DISK_USAGE_CACHE_MAX_AGE = 10.0  # seconds before stale entries are pruned
+_disk_usage_cache: dict[str, tuple[float, Any]] = {}
+_disk_usage_cache_lock = threading.Lock()
+
+
+def _cached_disk_usage(path: Union[str, Path]) -> Any:
+    """Get disk usage for a path, reusing results younger than the TTL.
+
+    Args:
+        path: Path to query
+
+    Returns:
+        shutil.disk_usage result (total, used, free)
+
+    Raises:
+        OSError: If disk usage cannot be determined
+    """
+    key = os.path.abspath(path)
+    now = time.monotonic()
+
+    with _disk_usage_cache_lock:
+        cached = _disk_usage_cache.get(key)
+        if cached is not None and now - cached[0] < DISK_USAGE_CACHE_TTL:
+            return cached[1]
+
+    usage = shutil.disk_usage(key)
+
+    with _disk_usage_cache_lock:
+        # Opportunistically drop entries nobody has asked for recently
+        for stale_key in [
+            k
+            for k, (ts, _) in _disk_usage_cache.items()
+            if now - ts > _DISK_USAGE_CACHE_MAX_AGE
+        ]:
+            del _disk_usage_cache[stale_key]
+        _disk_usage_cache[key] = (now, usage)
+
+    return usage
+
+
 def check_disk_space(
     path: Union[str, Path], required_gb: float = MIN_DISK_SPACE_GB
 ) -> bool:
     """Check if there is sufficient disk space available.
 
+    Results are cached per path for DISK_USAGE_CACHE_TTL seconds, so
+    back-to-back checks issue a single statvfs call.
+
     Args:
         path: Path to check disk space for
         required_gb: Required space in GB
@@ -49,8 +97,8 @@ def check_disk_space(
         InsufficientSpaceError: If there is not enough space
     """
     try:
-        stat = shutil.disk_usage(path)
-        available_gb = stat.free / (1024**3)
+        usage = _cached_disk_usage(path)
+        available_gb = usage.free / (1024**3)
 
         if available_gb < required_gb:
             raise InsufficientSpaceError(
@@ -82,8 +130,15 @@ def validate_paths(*paths: Union[str, Path]) -> bool:
     for path in paths:
         path_obj = Path(path)
 
+        # Reason: one stat per path answers exists/is_file/is_dir together,
+        # instead of a separate syscall for each Path predicate.
+        try:
+            mode: Optional[int] = os.stat(path_obj).st_mode
+        except (FileNotFoundError, NotADirectoryError):
+            mode = None
+
         # Check if parent directory exists and is writable for output paths
-        if not path_obj.exists():
+        if mode is None:
             parent = path_obj.parent
             if not parent.exists():
                 raise FileNotFoundError(f"Parent directory does not exist: {parent}")
@@ -91,11 +146,11 @@ def validate_paths(*paths: Union[str, Path]) -> bool:
                 raise PermissionError(f"No write permission for directory: {parent}")
 
         # Check read permission for existing files
-        elif path_obj.is_file() and not os.access(path_obj, os.R_OK):
+        elif stat.S_ISREG(mode) and not os.access(path_obj, os.R_OK):
             raise PermissionError(f"No read permission for file: {path_obj}")
 
         # Check write permission for existing directories
-        elif path_obj.is_dir() and not os.access(path_obj, os.W_OK):
+        elif stat.S_ISDIR(mode) and not os.access(path_obj, os.W_OK):
             raise PermissionError(f"No write permission for directory: {path_obj}")
 
     return True
@@ -194,8 +249,10 @@ class safe_file_operations:
             cleanup_on_error: Whether to clean up created files on error
         """
         self.cleanup_on_error = cleanup_on_error
-        self.created_files: list[Path] = []
-        self.created_dirs: list[Path] = []
+        # Reason: paths are kept as plain strings and only handed to os-level
+        # calls, so no Path objects are built per tracked entry
+        self.created_files: list[str] = []
+        self.created_dirs: list[str] = []
 
     def __enter__(self) -> "safe_file_operations":
         """Enter the context manager."""
@@ -214,7 +271,7 @@ class safe_file_operations:
         Args:
             file_path: Path to the file to track
         """
-        self.created_files.append(Path(file_path))
+        self.created_files.append(os.fspath(file_path))
 
     def track_directory(self, dir_path: Union[str, Path]) -> None:
         """Track a directory for potential cleanup.
@@ -222,27 +279,39 @@ class safe_file_operations:
         Args:
             dir_path: Path to the directory to track
         """
-        self.created_dirs.append(Path(dir_path))
+        self.created_dirs.append(os.fspath(dir_path))
 
     def _cleanup_created_files(self) -> None:
         """Clean up all tracked files and directories."""
-        # Clean up files first
+        # Clean up files first (a missing file needs no cleanup, so no pre-check)
         for file_path in self.created_files:
             try:
-                if file_path.exists():
-                    file_path.unlink()
-                    logger.debug(f"Cleaned up file: {file_path}")
+                os.unlink(file_path)
+                logger.debug(f"Cleaned up file: {file_path}")
+            except FileNotFoundError:
+                pass
             except OSError as e:
                 logger.warning(f"Failed to clean up file {file_path}: {e}")
 
-        # Clean up directories (in reverse order)
-        for dir_path in reversed(self.created_dirs):
+        # Clean up directories, skipping any nested inside another tracked
+        # directory since removing the outer tree already takes them along
+        root_dirs: list[str] = []
+        for dir_path in sorted({os.path.abspath(d) for d in self.created_dirs}):
+            if not any(
+                dir_path.startswith(root.rstrip(os.sep) + os.sep) for root in root_dirs
+            ):
+                root_dirs.append(dir_path)
+
+        for dir_path in root_dirs:
             try:
-                if dir_path.exists():
-                    shutil.rmtree(dir_path)
-                    logger.debug(f"Cleaned up directory: {dir_path}")
+                shutil.rmtree(dir_path)
+                logger.debug(f"Cleaned up directory: {dir_path}")
             except OSError as e:
-                logger.warning(f"Failed to clean up directory {dir_path}: {e}")
+                # Reason: only a missing root means there was nothing to clean;
+                # any other failure, including an entry vanishing mid-walk,
+                # may leave part of the tree behind
+                if os.path.lexists(dir_path):
+                    logger.warning(f"Failed to clean up directory {dir_path}: {e}")
 
 
 def ensure_parent_directory(file_path: Union[str, Path]) -> None:
@@ -287,6 +356,10 @@ def get_file_size(file_path: Union[str, Path]) -> int:
         raise FilesystemError(f"Cannot get file size for {path}: {e}") from e
 
 
+# (unit, divisor) pairs indexed by floor(log1024(size_bytes))
+_SIZE_UNITS = (("bytes", 1), ("KB", 1024), ("MB", 1024**2), ("GB", 1024**3))
+
+
 def format_file_size(size_bytes: int) -> str:
     """Format file size in human-readable format.
 
@@ -296,15 +369,14 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         Formatted size string
     """
-    if size_bytes >= 1024**3:
-        return f"{size_bytes / (1024**3):.2f} GB"
-    elif size_bytes >= 1024**2:
-        return f"{size_bytes / (1024**2):.2f} MB"
-    elif size_bytes >= 1024:
-        return f"{size_bytes / 1024:.2f} KB"
-    else:
+    if size_bytes < 1024:
         return f"{size_bytes} bytes"
 
+    # Reason: every unit is a power of 1024 (2**10), so the bit length picks
+    # the unit directly instead of walking a comparison ladder
+    unit, divisor = _SIZE_UNITS[min((int(size_bytes).bit_length() - 1) // 10, 3)]
+    return f"{size_bytes / divisor:.2f} {unit}"
+
 
 # System-specific file patterns to exclude from archives
 SYSTEM_FILE_PATTERNS = {
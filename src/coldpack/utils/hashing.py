@@ -245,7 +245,10 @@ class HashVerifier:
 
     @staticmethod
     def verify_file_hash(
-        file_path: Union[str, Path], hash_file_path: Union[str, Path], algorithm: str
+        file_path: Union[str, Path],
+        hash_file_path: Union[str, Path],
+        algorithm: str,
+        expected: Optional[tuple[str, str]] = None,
     ) -> bool:
         """Verify a file against its hash file.
 
@@ -253,6 +256,8 @@ class HashVerifier:
             file_path: Path to the file to verify
             hash_file_path: Path to the hash file
             algorithm: Hash algorithm name (sha256, blake3)
+            expected: Optional pre-read (hash_value, filename) tuple for
+                hash_file_path, as returned by read_hash_file
 
         Returns:
             True if verification passes
@@ -261,9 +266,11 @@ class HashVerifier:
             HashingError: If verification fails or cannot be performed
         """
         try:
-            # Read expected hash from file
-            expected_hash, expected_filename = HashVerifier.read_hash_file(
-                hash_file_path
+            # Read expected hash from file unless the caller already parsed it
+            expected_hash, expected_filename = (
+                expected
+                if expected is not None
+                else HashVerifier.read_hash_file(hash_file_path)
             )
 
             # Check filename matches
@@ -3,9 +3,15 @@
 
 """PAR2 recovery file management and verification."""
 
+import functools
+import os
 import shutil
 import subprocess
 import sys
+import threading
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional, Union
 
@@ -13,6 +19,12 @@ from loguru import logger
 
 from ..config.constants import DEFAULT_PAR2_REDUNDANCY, PAR2_BLOCK_COUNT
 
+# Number of trailing stderr lines kept for error messages
+PAR2_STDERR_TAIL_LINES = 64
+
+# Upper bound on concurrent par2 verifications, to avoid disk thrashing on HDDs
+PAR2_VERIFY_MAX_WORKERS = 4
+
 
 class PAR2Error(Exception):
     """Base exception for PAR2 operations."""
@@ -26,6 +38,186 @@ class PAR2NotFoundError(PAR2Error):
     pass
 
 
+def _run_par2(cmd: list[str], work_dir: Path, timeout: float) -> tuple[int, str]:
+    """Run a par2 command without buffering its full output.
+
+    stdout is discarded and stderr is drained into a bounded buffer, so memory
+    use stays constant no matter how much progress output par2 emits.
+
+    Args:
+        cmd: par2 command line
+        work_dir: Working directory for the command
+        timeout: Timeout in seconds
+
+    Returns:
+        Tuple of (exit code, last lines of stderr)
+
+    Raises:
+        subprocess.TimeoutExpired: If the command exceeds the timeout
+        OSError: If the command cannot be started
+    """
+    with subprocess.Popen(
+        cmd,
+        cwd=work_dir,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+    ) as process:
+        assert process.stderr is not None
+        stderr_tail: deque[str] = deque(maxlen=PAR2_STDERR_TAIL_LINES)
+        # Reason: drain stderr on a thread so wait() can enforce the timeout
+        # without par2 blocking on a full pipe.
+        drainer = threading.Thread(
+            target=stderr_tail.extend, args=(process.stderr,), daemon=True
+        )
+        drainer.start()
+
+        try:
+            returncode = process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            raise
+        finally:
+            drainer.join()
+
+    return returncode, "".join(stderr_tail)
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_par2_command() -> Optional[str]:
+    """Find available par2 command.
+
+    Candidates are accepted once they are found and executable; the tool is
+    not run here, so a broken install surfaces on first real use. The result
+    is cached for the lifetime of the process; call
+    ``_resolve_par2_command.cache_clear()`` to search again.
+
+    Returns:
+        Path to par2 command or None if not found
+    """
+    # Try different possible par2 command names
+    # Note: par2cmdline-turbo package installs 'par2' executable
+    candidates = ["par2", "par2cmdline", "par2create", "par2turbo"]
+
+    # First try to find commands in system PATH
+    for cmd in candidates:
+        if shutil.which(cmd):
+            logger.debug(f"Found PAR2 command in PATH: {cmd}")
+            return cmd
+
+    # If not found in PATH, try common installation locations
+    # Additional search paths for different installation methods
+    additional_paths = []
+
+    # Check if we're in a virtual environment or uv tool installation
+    if hasattr(sys, "real_prefix") or (
+        hasattr(sys, "base_prefix") and sys.base_prefix != sys.prefix
+    ):
+        # We're in a virtual environment (including uv tool environments)
+        venv_bin = Path(sys.prefix) / "bin"
+        if venv_bin.exists():
+            additional_paths.append(venv_bin)
+
+        # For Windows virtual environments
+        venv_scripts = Path(sys.prefix) / "Scripts"
+        if venv_scripts.exists():
+            additional_paths.append(venv_scripts)
+
+    # For uv tool installations, also check the executable's directory
+    try:
+        import coldpack
+
+        # Get coldpack package location
+        coldpack_module_path = Path(coldpack.__file__).parent
+
+        # Check multiple possible locations relative to coldpack installation
+        possible_locations = [
+            # For development installations (pip install -e .)
+            coldpack_module_path.parent.parent / "bin",
+            coldpack_module_path.parent.parent / "Scripts",  # Windows
+            # For wheel/site-packages installations
+            coldpack_module_path.parent / "bin",
+            coldpack_module_path.parent / "Scripts",  # Windows
+            # For uv tool installs - check if we're in a uv-managed environment
+            Path(sys.executable).parent,  # Same directory as Python executable
+            # Check if we're in site-packages and look for bundled tools
+            coldpack_module_path / "bin",
+            coldpack_module_path / "tools",
+        ]
+
+        additional_paths.extend(p for p in possible_locations if p.exists())
+    except Exception:
+        # If anything fails, just continue with other paths
+        pass
+
+    # Check executable's parent directory (for bundled installations)
+    exe_path = Path(sys.executable).parent
+    additional_paths.append(exe_path)
+
+    # macOS Homebrew paths
+    if sys.platform.startswith("darwin"):
+        homebrew_paths = [
+            Path("/opt/homebrew/bin"),  # Apple Silicon
+            Path("/usr/local/bin"),  # Intel
+        ]
+        additional_paths.extend(p for p in homebrew_paths if p.exists())
+
+    # Linux package manager paths
+    elif sys.platform.startswith("linux"):
+        linux_paths = [
+            Path("/usr/bin"),
+            Path("/usr/local/bin"),
+        ]
+        additional_paths.extend(p for p in linux_paths if p.exists())
+
+    # Windows paths
+    elif sys.platform.startswith("win"):
+        # Common Windows installation paths
+        windows_paths = [
+            Path("C:/Program Files/par2cmdline"),
+            Path("C:/Program Files (x86)/par2cmdline"),
+        ]
+        additional_paths.extend(p for p in windows_paths if p.exists())
+
+        # For Windows, also check common user installation locations
+        if "USERPROFILE" in os.environ:
+            user_profile = Path(os.environ["USERPROFILE"])
+            user_paths = [
+                user_profile
+                / "AppData"
+                / "Local"
+                / "uv"
+                / "tools"
+                / "coldpack"
+                / "Scripts",
+                user_profile / "scoop" / "apps" / "par2cmdline" / "current",
+                user_profile / "scoop" / "shims",
+            ]
+            additional_paths.extend(p for p in user_paths if p.exists())
+
+    # Try candidates in additional search paths
+    for search_path in additional_paths:
+        for cmd in candidates:
+            candidate_paths = [search_path / cmd]
+            if sys.platform.startswith("win"):
+                # Also try with .exe extension on Windows
+                candidate_paths.append(search_path / f"{cmd}.exe")
+
+            for candidate_path in candidate_paths:
+                if candidate_path.is_file() and os.access(candidate_path, os.X_OK):
+                    logger.debug(f"Found PAR2 command at: {candidate_path}")
+                    return str(candidate_path)
+
+    # Debug information about search paths
+    logger.debug(f"Searched for PAR2 commands: {candidates}")
+    logger.debug(
+        f"Additional search paths checked: {[str(p) for p in additional_paths]}"
+    )
+    logger.debug("No PAR2 command found in PATH or common locations")
+    return None
+
+
 class PAR2Manager:
     """Manager for PAR2 recovery file operations."""
 
@@ -50,6 +242,7 @@ class PAR2Manager:
             )
 
         self.par2_cmd = par2_cmd
+        self._is_turbo: Optional[bool] = None  # Probed lazily on first use
 
         logger.debug(
             f"PAR2Manager initialized: {redundancy_percent}% redundancy, command: {self.par2_cmd}"
@@ -61,167 +254,34 @@ class PAR2Manager:
         Returns:
             Path to par2 command or None if not found
         """
-        # Try different possible par2 command names
-        # Note: par2cmdline-turbo package installs 'par2' executable
-        candidates = ["par2", "par2cmdline", "par2create", "par2turbo"]
+        return _resolve_par2_command()
 
-        # First try to find commands in system PATH
-        for cmd in candidates:
-            if shutil.which(cmd):
-                try:
-                    # Test if the command works
-                    result = subprocess.run(
-                        [cmd, "--help"], capture_output=True, text=True, timeout=5
-                    )
-                    if result.returncode == 0:
-                        logger.debug(f"Found PAR2 command in PATH: {cmd}")
-                        return cmd
-                except (subprocess.TimeoutExpired, subprocess.SubprocessError):
-                    continue
-
-        # If not found in PATH, try common installation locations
-        import sys
-        from pathlib import Path
-
-        # Additional search paths for different installation methods
-        additional_paths = []
-
-        # Check if we're in a virtual environment or uv tool installation
-        if hasattr(sys, "real_prefix") or (
-            hasattr(sys, "base_prefix") and sys.base_prefix != sys.prefix
-        ):
-            # We're in a virtual environment (including uv tool environments)
-            venv_bin = Path(sys.prefix) / "bin"
-            if venv_bin.exists():
-                additional_paths.append(venv_bin)
-
-            # For Windows virtual environments
-            venv_scripts = Path(sys.prefix) / "Scripts"
-            if venv_scripts.exists():
-                additional_paths.append(venv_scripts)
-
-        # For uv tool installations, also check the executable's directory
-        try:
-            import coldpack
-
-            # Get coldpack package location
-            coldpack_module_path = Path(coldpack.__file__).parent
-
-            # Check multiple possible locations relative to coldpack installation
-            possible_locations = [
-                # For development installations (pip install -e .)
-                coldpack_module_path.parent.parent / "bin",
-                coldpack_module_path.parent.parent / "Scripts",  # Windows
-                # For wheel/site-packages installations
-                coldpack_module_path.parent / "bin",
-                coldpack_module_path.parent / "Scripts",  # Windows
-                # For uv tool installs - check if we're in a uv-managed environment
-                Path(sys.executable).parent,  # Same directory as Python executable
-                # Check if we're in site-packages and look for bundled tools
-                coldpack_module_path / "bin",
-                coldpack_module_path / "tools",
-            ]
-
-            additional_paths.extend(p for p in possible_locations if p.exists())
-        except Exception:
-            # If anything fails, just continue with other paths
-            pass
+    @property
+    def is_turbo(self) -> bool:
+        """Whether the resolved par2 command is par2cmdline-turbo.
 
-        # Check executable's parent directory (for bundled installations)
-        exe_path = Path(sys.executable).parent
-        additional_paths.append(exe_path)
+        par2cmdline-turbo uses SIMD Galois-field kernels and is several times
+        faster than baseline par2cmdline for create/verify operations.
 
-        # macOS Homebrew paths
-        if sys.platform.startswith("darwin"):
-            homebrew_paths = [
-                Path("/opt/homebrew/bin"),  # Apple Silicon
-                Path("/usr/local/bin"),  # Intel
-            ]
-            additional_paths.extend(p for p in homebrew_paths if p.exists())
+        Returns:
+            True if ``par2 -V`` reports a turbo build
+        """
+        if self._is_turbo is None:
+            try:
+                result = subprocess.run(
+                    [self.par2_cmd, "-V"], capture_output=True, text=True, timeout=5
+                )
+                self._is_turbo = "turbo" in (result.stdout + result.stderr).lower()
+            except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError):
+                self._is_turbo = False
+
+            if not self._is_turbo:
+                logger.debug(
+                    "Using baseline par2cmdline; install par2cmdline-turbo "
+                    "for faster PAR2 operations"
+                )
 
-        # Linux package manager paths
-        elif sys.platform.startswith("linux"):
-            linux_paths = [
-                Path("/usr/bin"),
-                Path("/usr/local/bin"),
-            ]
-            additional_paths.extend(p for p in linux_paths if p.exists())
-
-        # Windows paths
-        elif sys.platform.startswith("win"):
-            # Common Windows installation paths
-            windows_paths = [
-                Path("C:/Program Files/par2cmdline"),
-                Path("C:/Program Files (x86)/par2cmdline"),
-            ]
-            additional_paths.extend(p for p in windows_paths if p.exists())
-
-            # For Windows, also check common user installation locations
-            import os
-
-            if "USERPROFILE" in os.environ:
-                user_profile = Path(os.environ["USERPROFILE"])
-                user_paths = [
-                    user_profile
-                    / "AppData"
-                    / "Local"
-                    / "uv"
-                    / "tools"
-                    / "coldpack"
-                    / "Scripts",
-                    user_profile / "scoop" / "apps" / "par2cmdline" / "current",
-                    user_profile / "scoop" / "shims",
-                ]
-                additional_paths.extend(p for p in user_paths if p.exists())
-
-        # Try candidates in additional search paths
-        for search_path in additional_paths:
-            for cmd in candidates:
-                full_path = search_path / cmd
-                if sys.platform.startswith("win"):
-                    # Also try with .exe extension on Windows
-                    full_path_exe = search_path / f"{cmd}.exe"
-                    for candidate_path in [full_path, full_path_exe]:
-                        if candidate_path.exists() and candidate_path.is_file():
-                            try:
-                                result = subprocess.run(
-                                    [str(candidate_path), "--help"],
-                                    capture_output=True,
-                                    text=True,
-                                    timeout=5,
-                                )
-                                if result.returncode == 0:
-                                    logger.debug(
-                                        f"Found PAR2 command at: {candidate_path}"
-                                    )
-                                    return str(candidate_path)
-                            except (
-                                subprocess.TimeoutExpired,
-                                subprocess.SubprocessError,
-                            ):
-                                continue
-                else:
-                    if full_path.exists() and full_path.is_file():
-                        try:
-                            result = subprocess.run(
-                                [str(full_path), "--help"],
-                                capture_output=True,
-                                text=True,
-                                timeout=5,
-                            )
-                            if result.returncode == 0:
-                                logger.debug(f"Found PAR2 command at: {full_path}")
-                                return str(full_path)
-                        except (subprocess.TimeoutExpired, subprocess.SubprocessError):
-                            continue
-
-        # Debug information about search paths
-        logger.debug(f"Searched for PAR2 commands: {candidates}")
-        logger.debug(
-            f"Additional search paths checked: {[str(p) for p in additional_paths]}"
-        )
-        logger.debug("No PAR2 command found in PATH or common locations")
-        return None
+        return self._is_turbo
 
     def create_recovery_files(
         self, file_path: Union[str, Path], output_dir: Optional[Path] = None
@@ -239,29 +299,90 @@ class PAR2Manager:
             FileNotFoundError: If input file doesn't exist
             PAR2Error: If PAR2 creation fails
         """
-        file_obj = Path(file_path)
+        return self.create_recovery_files_batch([file_path], output_dir=output_dir)
+
+    def create_recovery_files_batch(
+        self,
+        file_paths: Sequence[Union[str, Path]],
+        output_dir: Optional[Path] = None,
+    ) -> list[Path]:
+        """Create PAR2 recovery files for several files, one par2 run per directory.
+
+        Files sharing a parent directory are protected by a single recovery set
+        named after the first file of that directory. Only that file's name
+        matches the set, so name-based discovery (``_find_par2_files`` and the
+        verifier) finds no recovery files for the other files in the group;
+        callers must keep the returned paths and verify or repair those files
+        through the set's main ``.par2`` file.
+
+        Args:
+            file_paths: Paths to the files to protect
+            output_dir: Optional directory to place PAR2 files (default: next to
+                files); must be inside the parent directory of every file
+
+        Returns:
+            List of created PAR2 recovery file paths
+
+        Raises:
+            FileNotFoundError: If an input file doesn't exist
+            PAR2Error: If output_dir is outside a file's parent directory, or
+                if PAR2 creation fails
+        """
+        groups: dict[Path, list[Path]] = {}
+        for file_path in file_paths:
+            file_obj = Path(file_path)
+
+            if not file_obj.exists():
+                raise FileNotFoundError(f"File not found: {file_obj}")
+
+            groups.setdefault(file_obj.parent, []).append(file_obj)
 
-        if not file_obj.exists():
-            raise FileNotFoundError(f"File not found: {file_obj}")
+        # Reason: par2 -B needs output_dir relative to each group's directory;
+        # check all groups before running par2 so no set is left half-written
+        if output_dir:
+            for parent in groups:
+                if not output_dir.is_relative_to(parent):
+                    raise PAR2Error(
+                        f"PAR2 output directory {output_dir} is not inside {parent}"
+                    )
+
+        created_files: list[Path] = []
+        for parent, files in groups.items():
+            created_files.extend(self._create_recovery_set(parent, files, output_dir))
+
+        return created_files
+
+    def _create_recovery_set(
+        self, work_dir: Path, files: list[Path], output_dir: Optional[Path]
+    ) -> list[Path]:
+        """Run a single par2 create command protecting files in one directory.
+
+        Args:
+            work_dir: Directory containing all files to protect
+            files: Files to protect, the first one names the recovery set
+            output_dir: Optional directory to place PAR2 files
+
+        Returns:
+            List of created PAR2 recovery file paths
+
+        Raises:
+            PAR2Error: If PAR2 creation fails
+        """
+        par2_base = files[0].name  # Base name for PAR2 files
+        target_files = [f.name for f in files]  # Files to protect (relative paths)
 
         if output_dir:
             # Use PAR2 -B (basepath) parameter to create files directly in output directory
             # This avoids the need to create files and then move them
             output_dir.mkdir(parents=True, exist_ok=True)
 
-            # The basepath should be the directory containing the file to protect
-            basepath = str(file_obj.parent.absolute())
-
-            # PAR2 files will be created in output_dir, with basepath-relative file references
-            par2_base = file_obj.name  # Base name for PAR2 files
-            target_file = file_obj.name  # File to protect (relative to basepath)
+            # The basepath should be the directory containing the files to protect
+            basepath = str(work_dir.absolute())
 
             # Build par2 create command with -B parameter
-            # Format: par2 create -B<basepath> -r<redundancy> -n<count> -q <relative_par2_path> <target_file>
+            # Format: par2 create -B<basepath> -r<redundancy> -n<count> -q <relative_par2_path> <target_file>...
             # Example: par2 create -B"/base/path" -r10 -n1 -q metadata/file.par2 file.ext
-            relative_output_path = output_dir.relative_to(
-                file_obj.parent
-            )  # e.g., "metadata"
+            relative_output_path = output_dir.relative_to(work_dir)  # e.g., "metadata"
             cmd = [
                 self.par2_cmd,
                 "create",
@@ -270,17 +391,10 @@ class PAR2Manager:
                 f"-n{PAR2_BLOCK_COUNT}",  # Number of recovery files
                 "-q",  # Quiet mode
                 str(relative_output_path / par2_base),  # Relative path for PAR2 files
-                target_file,  # File to protect (relative to working directory)
+                *target_files,  # Files to protect (relative to working directory)
             ]
-
-            work_dir = file_obj.parent  # Run from directory containing the target file
         else:
-            # Standard creation in same directory as protected file
-            work_dir = file_obj.parent
-            par2_base = file_obj.name  # Base name for PAR2 files
-            target_file = file_obj.name  # File to protect (same directory)
-
-            # Build standard par2 create command
+            # Standard creation in same directory as protected files
             cmd = [
                 self.par2_cmd,
                 "create",
@@ -288,51 +402,38 @@ class PAR2Manager:
                 f"-n{PAR2_BLOCK_COUNT}",  # Number of recovery files
                 "-q",  # Quiet mode
                 par2_base,  # Base name for PAR2 files
-                target_file,  # File to protect (relative path)
+                *target_files,  # Files to protect (relative paths)
             ]
 
         try:
             logger.debug(
-                f"Creating PAR2 recovery files ({self.redundancy_percent}% redundancy)"
+                f"Creating PAR2 recovery files for {len(files)} file(s) "
+                f"({self.redundancy_percent}% redundancy)"
             )
 
             # Debug: Log the command and working directory
             logger.debug(f"PAR2 command: {' '.join(cmd)}")
             logger.debug(f"Working directory: {work_dir}")
-            logger.debug(
-                f"Target file exists: {(work_dir / target_file).exists() if work_dir else False}"
-            )
 
-            # Execute par2 create command
-            result = subprocess.run(
-                cmd,
-                cwd=work_dir,
-                capture_output=True,
-                text=True,
-                timeout=3600,  # 1 hour timeout for large files
-            )
+            # Execute par2 create command (1 hour timeout for large files)
+            returncode, stderr = _run_par2(cmd, work_dir, timeout=3600)
 
-            if result.returncode != 0:
+            if returncode != 0:
                 raise PAR2Error(
-                    f"PAR2 create failed (exit code {result.returncode}): "
-                    f"{result.stderr}"
+                    f"PAR2 create failed (exit code {returncode}): {stderr}"
                 )
 
             # Find all created PAR2 files in the appropriate location
-            if output_dir:
-                par2_files = self._find_par2_files_in_dir(file_obj, output_dir)
-            else:
-                par2_files = self._find_par2_files(file_obj)
+            scanned = self._scan_par2_files(output_dir or work_dir, par2_base)
 
-            if not par2_files:
+            if not scanned:
                 raise PAR2Error("No PAR2 files were created")
 
-            logger.debug(f"Generated {len(par2_files)} PAR2 recovery files")
-            for par2_file in par2_files:
-                file_size = par2_file.stat().st_size
+            logger.debug(f"Generated {len(scanned)} PAR2 recovery files")
+            for par2_file, file_size in scanned:
                 logger.debug(f"  {par2_file.name} ({file_size} bytes)")
 
-            return par2_files
+            return [par2_file for par2_file, _ in scanned]
 
         except subprocess.TimeoutExpired as e:
             raise PAR2Error(
@@ -372,7 +473,8 @@ class PAR2Manager:
                 self.par2_cmd,
                 "verify",
                 f"-B{basepath}",  # Use the 7z directory as basepath
-                "-q",  # Quiet mode
+                "-q",  # Silent mode (-q twice): the exit code carries the result
+                "-q",
                 par2_rel_path,
             ]
         else:
@@ -383,7 +485,8 @@ class PAR2Manager:
             cmd = [
                 self.par2_cmd,
                 "verify",
-                "-q",  # Quiet mode
+                "-q",  # Silent mode (-q twice): the exit code carries the result
+                "-q",
                 par2_rel_path,  # PAR2 file name
             ]
 
@@ -392,20 +495,15 @@ class PAR2Manager:
             if par2_obj.parent.name == "metadata":
                 logger.debug(f"Using basepath: {basepath}")
 
-            result = subprocess.run(
-                cmd,
-                cwd=work_dir,
-                capture_output=True,
-                text=True,
-                timeout=1800,  # 30 minutes timeout
-            )
+            # 30 minutes timeout
+            returncode, stderr = _run_par2(cmd, work_dir, timeout=1800)
 
-            if result.returncode == 0:
+            if returncode == 0:
                 logger.success("PAR2 integrity check passed")
                 return True
             else:
                 logger.error(
-                    f"PAR2 verification failed (exit code {result.returncode}): {result.stderr}"
+                    f"PAR2 verification failed (exit code {returncode}): {stderr}"
                 )
                 return False
 
@@ -414,6 +512,42 @@ class PAR2Manager:
         except subprocess.SubprocessError as e:
             raise PAR2Error(f"PAR2 verification command failed: {e}") from e
 
+    def verify_recovery_files_batch(
+        self, par2_files: Sequence[Union[str, Path]]
+    ) -> dict[Path, bool]:
+        """Verify several PAR2 recovery sets concurrently.
+
+        Args:
+            par2_files: Paths to main .par2 files
+
+        Returns:
+            Mapping of each .par2 file to whether its verification passed
+        """
+        par2_objs = [Path(par2_file) for par2_file in par2_files]
+        if not par2_objs:
+            return {}
+
+        # Reason: the work happens in par2 subprocesses, so threads that just
+        # wait on them are enough to run verifications in parallel
+        max_workers = min(os.cpu_count() or 1, PAR2_VERIFY_MAX_WORKERS, len(par2_objs))
+        logger.debug(f"Verifying {len(par2_objs)} PAR2 sets with {max_workers} workers")
+
+        results: dict[Path, bool] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.verify_recovery_files, par2_obj): par2_obj
+                for par2_obj in par2_objs
+            }
+            for future in as_completed(futures):
+                par2_obj = futures[future]
+                try:
+                    results[par2_obj] = future.result()
+                except (OSError, PAR2Error) as e:
+                    logger.error(f"PAR2 verification failed for {par2_obj}: {e}")
+                    results[par2_obj] = False
+
+        return results
+
     def repair_file(self, par2_file: Union[str, Path]) -> bool:
         """Attempt to repair a file using PAR2 recovery data.
 
@@ -460,21 +594,14 @@ class PAR2Manager:
         try:
             logger.info(f"Attempting PAR2 repair using: {par2_obj.name}")
 
-            result = subprocess.run(
-                cmd,
-                cwd=work_dir,
-                capture_output=True,
-                text=True,
-                timeout=3600,  # 1 hour timeout
-            )
+            # 1 hour timeout
+            returncode, stderr = _run_par2(cmd, work_dir, timeout=3600)
 
-            if result.returncode == 0:
+            if returncode == 0:
                 logger.success("PAR2 repair completed successfully")
                 return True
             else:
-                logger.error(
-                    f"PAR2 repair failed (exit code {result.returncode}): {result.stderr}"
-                )
+                logger.error(f"PAR2 repair failed (exit code {returncode}): {stderr}")
                 return False
 
         except subprocess.TimeoutExpired as e:
@@ -491,16 +618,7 @@ class PAR2Manager:
         Returns:
             List of PAR2 file paths
         """
-        par2_files = []
-        base_pattern = original_file.name
-
-        # Look for PAR2 files in the same directory
-        for file_path in original_file.parent.iterdir():
-            if file_path.name.startswith(base_pattern) and file_path.suffix == ".par2":
-                par2_files.append(file_path)
-
-        # Sort to ensure consistent ordering
-        return sorted(par2_files)
+        return self._find_par2_files_in_dir(original_file, original_file.parent)
 
     def _find_par2_files_in_dir(
         self, original_file: Path, search_dir: Path
@@ -514,16 +632,35 @@ class PAR2Manager:
         Returns:
             List of PAR2 file paths
         """
-        par2_files = []
-        base_pattern = original_file.name
+        return [
+            path for path, _ in self._scan_par2_files(search_dir, original_file.name)
+        ]
 
-        # Look for PAR2 files in the specified directory
-        for file_path in search_dir.iterdir():
-            if file_path.name.startswith(base_pattern) and file_path.suffix == ".par2":
-                par2_files.append(file_path)
+    @staticmethod
+    def _scan_par2_files(parent: Path, name_prefix: str) -> list[tuple[Path, int]]:
+        """Scan a directory once for PAR2 files and their sizes.
+
+        Names are filtered on the DirEntry before any Path object is built, and
+        sizes come from DirEntry.stat(), which is cached per entry.
+
+        Args:
+            parent: Directory to scan
+            name_prefix: Name the PAR2 files start with (the protected file name)
+
+        Returns:
+            Sorted list of (PAR2 file path, size in bytes) tuples
+        """
+        with os.scandir(parent) as entries:
+            found = [
+                (Path(entry.path), entry.stat().st_size)
+                for entry in entries
+                if entry.name.startswith(name_prefix)
+                and entry.name.endswith(".par2")
+                and entry.is_file()
+            ]
 
         # Sort to ensure consistent ordering
-        return sorted(par2_files)
+        return sorted(found)
 
     def get_recovery_info(self, par2_file: Union[str, Path]) -> dict:
         """Get information about PAR2 recovery files.
@@ -545,14 +682,12 @@ class PAR2Manager:
 
         # Find all related PAR2 files
         original_file_pattern = par2_obj.name.replace(".par2", "")
-        all_par2_files = self._find_par2_files(par2_obj.parent / original_file_pattern)
-
-        total_size = sum(f.stat().st_size for f in all_par2_files)
+        scanned = self._scan_par2_files(par2_obj.parent, original_file_pattern)
 
         return {
-            "par2_files": [str(f) for f in all_par2_files],
-            "file_count": len(all_par2_files),
-            "total_size": total_size,
+            "par2_files": [str(f) for f, _ in scanned],
+            "file_count": len(scanned),
+            "total_size": sum(size for _, size in scanned),
             "redundancy_percent": self.redundancy_percent,
             "main_par2_file": str(par2_obj),
         }
@@ -597,49 +732,60 @@ def get_par2_version() -> Optional[str]:
         return None
 
 
+_PAR2_INSTALL_BASE_MSG = (
+    "Note: coldpack includes par2cmdline-turbo as a dependency, but the executable may not be in PATH.\n"
+    "If you installed coldpack with 'uv tool install', PAR2 tools should be available but may need manual setup.\n\n"
+)
+
+# Installation instructions keyed by sys.platform prefix
+_PAR2_INSTALL_INSTRUCTIONS = {
+    "darwin": _PAR2_INSTALL_BASE_MSG
+    + (
+        "Install PAR2 on macOS:\n"
+        "  brew install par2cmdline\n"
+        "  or\n"
+        "  brew install par2cmdline-turbo\n"
+        "\nAlternatively, ensure the bundled PAR2 tool is accessible:\n"
+        "  Check if 'which par2' returns a valid path"
+    ),
+    "linux": _PAR2_INSTALL_BASE_MSG
+    + (
+        "Install PAR2 on Linux:\n"
+        "  Ubuntu/Debian: sudo apt install par2cmdline\n"
+        "  CentOS/RHEL: sudo yum install par2cmdline\n"
+        "  Arch: sudo pacman -S par2cmdline\n"
+        "  or install par2cmdline-turbo for better performance\n"
+        "\nAlternatively, ensure the bundled PAR2 tool is accessible:\n"
+        "  Check if 'which par2' returns a valid path"
+    ),
+    "win": _PAR2_INSTALL_BASE_MSG
+    + (
+        "Install PAR2 on Windows:\n"
+        "  Download from: https://github.com/Parchive/par2cmdline/releases\n"
+        "  or use chocolatey: choco install par2cmdline\n"
+        "  or use winget: winget install par2cmdline\n"
+        "\nAlternatively, ensure the bundled PAR2 tool is accessible:\n"
+        "  Check if 'par2.exe' is available in your PATH"
+    ),
+}
+
+_PAR2_INSTALL_GENERIC = _PAR2_INSTALL_BASE_MSG + (
+    "Install PAR2 for your platform:\n"
+    "  Visit: https://github.com/Parchive/par2cmdline\n"
+    "  or: https://github.com/animetosho/par2cmdline-turbo\n"
+    "\nAlternatively, ensure the bundled PAR2 tool is accessible in your PATH"
+)
+
+# The platform never changes at runtime, so resolve the matching key once
+_PLATFORM_KEY = next(
+    (key for key in _PAR2_INSTALL_INSTRUCTIONS if sys.platform.startswith(key)), ""
+)
+
+
 def install_par2_instructions() -> str:
     """Get installation instructions for PAR2 based on the current platform.
 
     Returns:
         Installation instructions string
     """
-    base_msg = (
-        "Note: coldpack includes par2cmdline-turbo as a dependency, but the executable may not be in PATH.\n"
-        "If you installed coldpack with 'uv tool install', PAR2 tools should be available but may need manual setup.\n\n"
-    )
-
-    if sys.platform.startswith("darwin"):  # macOS
-        return base_msg + (
-            "Install PAR2 on macOS:\n"
-            "  brew install par2cmdline\n"
-            "  or\n"
-            "  brew install par2cmdline-turbo\n"
-            "\nAlternatively, ensure the bundled PAR2 tool is accessible:\n"
-            "  Check if 'which par2' returns a valid path"
-        )
-    elif sys.platform.startswith("linux"):  # Linux
-        return base_msg + (
-            "Install PAR2 on Linux:\n"
-            "  Ubuntu/Debian: sudo apt install par2cmdline\n"
-            "  CentOS/RHEL: sudo yum install par2cmdline\n"
-            "  Arch: sudo pacman -S par2cmdline\n"
-            "  or install par2cmdline-turbo for better performance\n"
-            "\nAlternatively, ensure the bundled PAR2 tool is accessible:\n"
-            "  Check if 'which par2' returns a valid path"
-        )
-    elif sys.platform.startswith("win"):  # Windows
-        return base_msg + (
-            "Install PAR2 on Windows:\n"
-            "  Download from: https://github.com/Parchive/par2cmdline/releases\n"
-            "  or use chocolatey: choco install par2cmdline\n"
-            "  or use winget: winget install par2cmdline\n"
-            "\nAlternatively, ensure the bundled PAR2 tool is accessible:\n"
-            "  Check if 'par2.exe' is available in your PATH"
-        )
-    else:
-        return base_msg + (
-            "Install PAR2 for your platform:\n"
-            "  Visit: https://github.com/Parchive/par2cmdline\n"
-            "  or: https://github.com/animetosho/par2cmdline-turbo\n"
-            "\nAlternatively, ensure the bundled PAR2 tool is accessible in your PATH"
-        )
+    return _PAR2_INSTALL_INSTRUCTIONS.get(_PLATFORM_KEY, _PAR2_INSTALL_GENERIC)
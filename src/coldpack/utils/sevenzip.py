@@ -3,14 +3,35 @@
 
 """7z compression utilities using py7zz library."""
 
+import bisect
+import os
+import struct
+import time
+import zlib
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Callable, Optional, Union
 
 import py7zz
 from loguru import logger
 
+from ..config.constants import PROGRESS_UPDATE_INTERVAL
 from ..config.settings import SevenZipSettings
 
+# 7z signature header: 6-byte magic, 2-byte version, then the start header
+# (CRC32, next header offset/size/CRC32) for a fixed 32 bytes in total
+SEVENZ_SIGNATURE = b"7z\xbc\xaf\x27\x1c"
+SEVENZ_SIGNATURE_HEADER_SIZE = 32
+
+# LZMA2 gains little beyond 16 threads, and inputs under 1 MiB fill at most a
+# couple of LZMA2 blocks, so extra threads there only add startup overhead
+SEVENZ_MAX_THREADS = 16
+SEVENZ_SMALL_INPUT_THREADS = 2
+SEVENZ_SMALL_INPUT_SIZE = 1024 * 1024
+
+_CPU_COUNT = os.cpu_count() or 1
+
 
 class SevenZipError(Exception):
     """Base exception for 7z operations."""
@@ -24,6 +45,36 @@ class CompressionError(SevenZipError):
     pass
 
 
+def _translate_compression_error(error: Exception) -> Exception:
+    """Map an exception raised during compression to the error to raise.
+
+    Args:
+        error: Exception raised by py7zz or the compression code
+
+    Returns:
+        Exception to re-raise in place of the original
+    """
+    # Checked in order, so the first matching type wins as in an except chain
+    translations = (
+        (RuntimeError, CompressionError, "7z compression failed"),
+        (
+            py7zz.FileNotFoundError,
+            FileNotFoundError,
+            "Source file not found during compression",
+        ),
+        (
+            py7zz.InsufficientSpaceError,
+            CompressionError,
+            "Insufficient disk space for compression",
+        ),
+    )
+    for source_type, target_type, message in translations:
+        if isinstance(error, source_type):
+            return target_type(f"{message}: {error}")
+
+    return CompressionError(f"Unexpected error during 7z compression: {error}")
+
+
 class SevenZipCompressor:
     """7z compressor using py7zz library with progress tracking support."""
 
@@ -35,6 +86,12 @@ class SevenZipCompressor:
         """
         self.settings = settings or SevenZipSettings()
 
+        # Reason: settings are fixed for the compressor's lifetime, so the py7zz
+        # config is built once instead of on every compression
+        self._config_dict = self.settings.to_py7zz_config()
+        # Disable auto_compression to use our specified method
+        self._config_dict["auto_compression"] = False
+
         # Display initialization settings including memory limit if set
         init_settings = f"level={self.settings.level}, dict={self.settings.dictionary_size}, threads={self.settings.threads}"
         if self.settings.memory_limit:
@@ -78,12 +135,7 @@ class SevenZipCompressor:
         logger.debug(f"7z settings: {settings_info}")
 
         try:
-            # Create configuration from settings using to_py7zz_config method
-            config_dict = self.settings.to_py7zz_config()
-            # Disable auto_compression to use our specified method
-            config_dict["auto_compression"] = False
-
-            config = py7zz.Config(**config_dict)
+            config = py7zz.Config(**self._config_dict)
 
             # Use SevenZipFile with detailed config for precise control
             with py7zz.SevenZipFile(str(archive_obj), "w", config=config) as sz:
@@ -92,20 +144,8 @@ class SevenZipCompressor:
             # Success will be logged in archiver with file size info
             logger.debug(f"7z compression completed: {archive_obj.name}")
 
-        except RuntimeError as e:
-            raise CompressionError(f"7z compression failed: {e}") from e
-        except py7zz.FileNotFoundError as e:
-            raise FileNotFoundError(
-                f"Source file not found during compression: {e}"
-            ) from e
-        except py7zz.InsufficientSpaceError as e:
-            raise CompressionError(
-                f"Insufficient disk space for compression: {e}"
-            ) from e
         except Exception as e:
-            raise CompressionError(
-                f"Unexpected error during 7z compression: {e}"
-            ) from e
+            raise _translate_compression_error(e) from e
 
     def compress_files(
         self,
@@ -127,49 +167,34 @@ class SevenZipCompressor:
         if not files:
             raise ValueError("No files provided for compression")
 
-        # Convert to Path objects and validate
-        file_paths = [Path(f) for f in files]
-        for file_path in file_paths:
-            if not file_path.exists():
+        # Validate in a single pass, keeping plain strings since py7zz takes str
+        file_paths: list[str] = []
+        for f in files:
+            file_path = os.fspath(f)
+            if not os.path.exists(file_path):
                 raise FileNotFoundError(f"Source file not found: {file_path}")
+            file_paths.append(file_path)
 
         archive_obj = Path(archive_path)
         archive_obj.parent.mkdir(parents=True, exist_ok=True)
 
         logger.debug(f"Compressing {len(files)} files to {archive_obj.name}")
         logger.debug(
-            f"File list: {[p.name for p in file_paths[:10]]}{' (+more)' if len(file_paths) > 10 else ''}"
+            f"File list: {[os.path.basename(p) for p in file_paths[:10]]}{' (+more)' if len(file_paths) > 10 else ''}"
         )
 
         try:
-            # Create configuration from settings using to_py7zz_config method
-            config_dict = self.settings.to_py7zz_config()
-            # Disable auto_compression to use our specified method
-            config_dict["auto_compression"] = False
-
-            config = py7zz.Config(**config_dict)
+            config = py7zz.Config(**self._config_dict)
 
             # Use SevenZipFile with detailed config for precise control
             with py7zz.SevenZipFile(str(archive_obj), "w", config=config) as sz:
                 for file_path in file_paths:
-                    sz.add(str(file_path))
+                    sz.add(file_path)
 
             logger.debug(f"7z archive created: {archive_obj.name} ({len(files)} files)")
 
-        except RuntimeError as e:
-            raise CompressionError(f"7z compression failed: {e}") from e
-        except py7zz.FileNotFoundError as e:
-            raise FileNotFoundError(
-                f"Source file not found during compression: {e}"
-            ) from e
-        except py7zz.InsufficientSpaceError as e:
-            raise CompressionError(
-                f"Insufficient disk space for compression: {e}"
-            ) from e
         except Exception as e:
-            raise CompressionError(
-                f"Unexpected error during 7z compression: {e}"
-            ) from e
+            raise _translate_compression_error(e) from e
 
     def test_integrity(self, archive_path: Union[str, Path]) -> bool:
         """Test 7z archive integrity.
@@ -180,27 +205,7 @@ class SevenZipCompressor:
         Returns:
             True if archive is valid, False otherwise
         """
-        archive_obj = Path(archive_path)
-
-        if not archive_obj.exists():
-            logger.warning(f"Archive not found for integrity test: {archive_obj.name}")
-            return False
-
-        try:
-            logger.debug(f"Testing 7z integrity: {archive_obj.name}")
-            # py7zz expects string paths
-            result = py7zz.test_archive(str(archive_obj))
-
-            if result:
-                logger.debug(f"7z integrity test passed: {archive_obj}")
-            else:
-                logger.warning(f"7z integrity test failed: {archive_obj.name}")
-
-            return bool(result)
-
-        except Exception as e:
-            logger.error(f"7z integrity test error: {e}")
-            return False
+        return _test_7z_integrity(archive_path)
 
     def _create_progress_adapter(
         self, coldpack_callback: Callable[[int, str], None]
@@ -213,6 +218,8 @@ class SevenZipCompressor:
         Returns:
             py7zz compatible progress callback
         """
+        last_percentage: Optional[int] = None
+        last_emit = float("-inf")
 
         def py7zz_progress_adapter(progress_info: Any) -> None:
             """Adapter function for py7zz progress callbacks.
@@ -220,24 +227,29 @@ class SevenZipCompressor:
             Args:
                 progress_info: py7zz ProgressInfo object with enhanced attributes
             """
+            nonlocal last_percentage, last_emit
             try:
                 # Extract percentage and current file from py7zz ProgressInfo
                 # New ProgressInfo has better structured data
-                if hasattr(progress_info, "percentage"):
-                    percentage = int(progress_info.percentage)
-                else:
-                    percentage = 0
-
-                if (
-                    hasattr(progress_info, "current_file")
-                    and progress_info.current_file
+                percentage = int(getattr(progress_info, "percentage", 0))
+
+                # Reason: py7zz can report far more often than a display needs,
+                # so only forward a changed percentage, at most once per update
+                # interval, while always letting completion through
+                now = time.monotonic()
+                if percentage == last_percentage or (
+                    percentage < 100 and now - last_emit < PROGRESS_UPDATE_INTERVAL
                 ):
-                    current_file = str(progress_info.current_file)
-                else:
-                    current_file = "Processing..."
+                    return
+                last_percentage = percentage
+                last_emit = now
+
+                current_file = getattr(progress_info, "current_file", None)
 
                 # Call coldpack callback with converted values
-                coldpack_callback(percentage, current_file)
+                coldpack_callback(
+                    percentage, str(current_file) if current_file else "Processing..."
+                )
 
             except Exception as e:
                 logger.debug(f"Error in progress callback adapter: {e}")
@@ -246,6 +258,23 @@ class SevenZipCompressor:
         return py7zz_progress_adapter
 
 
+# Size tiers for optimize_7z_compression_settings as (exclusive upper bound in
+# bytes, level, dictionary size, description); the last tier is unbounded.
+# Dictionaries stay near a quarter of the input or above: a larger dictionary
+# buys no ratio on small inputs but still has to be allocated and initialized
+_COMPRESSION_TIERS = (
+    (256 * 1024, 1, "128k", "tiny file optimization (< 256 KiB)"),
+    (1024**2, 3, "1m", "small file optimization (256 KiB – 1 MiB)"),
+    (4 * 1024**2, 5, "1m", "small-medium file optimization (1 – 4 MiB)"),
+    (8 * 1024**2, 5, "4m", "small-medium file optimization (4 – 8 MiB)"),
+    (64 * 1024**2, 6, "16m", "medium file optimization (8 – 64 MiB)"),
+    (512 * 1024**2, 7, "64m", "large file optimization (64 – 512 MiB)"),
+    (2 * 1024**3, 9, "256m", "very large file optimization (512 MiB – 2 GiB)"),
+    (None, 9, "512m", "huge file optimization (> 2 GiB)"),
+)
+_COMPRESSION_TIER_BOUNDS = [bound for bound, *_ in _COMPRESSION_TIERS[:-1]]
+
+
 def optimize_7z_compression_settings(
     source_size: int,
     threads: Union[int, bool] = True,
@@ -256,7 +285,8 @@ def optimize_7z_compression_settings(
     Uses the precise dynamic parameter table for optimal 7z compression:
     - < 256 KiB: level=1, dict=128k
     - 256 KiB – 1 MiB: level=3, dict=1m
-    - 1 – 8 MiB: level=5, dict=4m
+    - 1 – 4 MiB: level=5, dict=1m
+    - 4 – 8 MiB: level=5, dict=4m
     - 8 – 64 MiB: level=6, dict=16m
     - 64 – 512 MiB: level=7, dict=64m
     - 512 MiB – 2 GiB: level=9, dict=256m
@@ -264,119 +294,100 @@ def optimize_7z_compression_settings(
 
     Args:
         source_size: Size of source directory in bytes
-        threads: Thread configuration (True=all cores, False=single-thread, int=specific count)
+        threads: Thread configuration (True=all cores, capped at 16 and at 2 for
+            inputs under 1 MiB, False=single-thread, int=specific count)
         memory_limit: Memory limit for compression (e.g., '1g', '512m', '256k')
 
     Returns:
         Optimized SevenZipSettings based on precise size thresholds
     """
-    # Precise size thresholds (in bytes) based on the provided table
-    SIZE_256K = 256 * 1024
-    SIZE_1M = 1024 * 1024
-    SIZE_8M = 8 * 1024 * 1024
-    SIZE_64M = 64 * 1024 * 1024
-    SIZE_512M = 512 * 1024 * 1024
-    SIZE_2G = 2 * 1024 * 1024 * 1024
-
     logger.debug(f"Optimizing 7z settings for source size: {source_size:,} bytes")
 
-    if source_size < SIZE_256K:
-        # < 256 KiB: Minimal compression, tiny dictionary
-        settings = SevenZipSettings(
-            level=1,
-            dictionary_size="128k",
-            threads=threads,
-            solid=True,
-            method="LZMA2",
-            memory_limit=memory_limit,
-        )
-        logger.debug("Using tiny file optimization (< 256 KiB)")
-
-    elif source_size < SIZE_1M:
-        # 256 KiB – 1 MiB: Light compression, small dictionary
-        settings = SevenZipSettings(
-            level=3,
-            dictionary_size="1m",
-            threads=threads,
-            solid=True,
-            method="LZMA2",
-            memory_limit=memory_limit,
-        )
-        logger.debug("Using small file optimization (256 KiB – 1 MiB)")
-
-    elif source_size < SIZE_8M:
-        # 1 – 8 MiB: Balanced compression
-        settings = SevenZipSettings(
-            level=5,
-            dictionary_size="4m",
-            threads=threads,
-            solid=True,
-            method="LZMA2",
-            memory_limit=memory_limit,
-        )
-        logger.debug("Using small-medium file optimization (1 – 8 MiB)")
-
-    elif source_size < SIZE_64M:
-        # 8 – 64 MiB: Good compression, medium dictionary
-        settings = SevenZipSettings(
-            level=6,
-            dictionary_size="16m",
-            threads=threads,
-            solid=True,
-            method="LZMA2",
-            memory_limit=memory_limit,
-        )
-        logger.debug("Using medium file optimization (8 – 64 MiB)")
-
-    elif source_size < SIZE_512M:
-        # 64 – 512 MiB: Higher compression, large dictionary
-        settings = SevenZipSettings(
-            level=7,
-            dictionary_size="64m",
-            threads=threads,
-            solid=True,
-            method="LZMA2",
-            memory_limit=memory_limit,
-        )
-        logger.debug("Using large file optimization (64 – 512 MiB)")
-
-    elif source_size < SIZE_2G:
-        # 512 MiB – 2 GiB: Maximum compression, very large dictionary
-        settings = SevenZipSettings(
-            level=9,
-            dictionary_size="256m",
-            threads=threads,
-            solid=True,
-            method="LZMA2",
-            memory_limit=memory_limit,
-        )
-        logger.debug("Using very large file optimization (512 MiB – 2 GiB)")
-
-    else:
-        # > 2 GiB: Maximum compression, maximum dictionary
-        settings = SevenZipSettings(
-            level=9,
-            dictionary_size="512m",
-            threads=threads,
-            solid=True,
-            method="LZMA2",
-            memory_limit=memory_limit,
+    # Reason: "all cores" is resolved to an explicit count so LZMA2 is not left
+    # to its own default thread heuristics; explicit user choices are kept
+    if threads is True:
+        max_threads = (
+            SEVENZ_SMALL_INPUT_THREADS
+            if source_size < SEVENZ_SMALL_INPUT_SIZE
+            else SEVENZ_MAX_THREADS
         )
-        logger.debug("Using huge file optimization (> 2 GiB)")
+        threads = min(_CPU_COUNT, max_threads)
+
+    _, level, dictionary_size, description = _COMPRESSION_TIERS[
+        bisect.bisect_right(_COMPRESSION_TIER_BOUNDS, source_size)
+    ]
+    settings = SevenZipSettings(
+        level=level,
+        dictionary_size=dictionary_size,
+        threads=threads,
+        solid=True,
+        method="LZMA2",
+        memory_limit=memory_limit,
+    )
+    logger.debug(f"Using {description}")
 
     # Format threads display in a more user-friendly way
-    if threads is True:
-        threads_display = "all"
-    elif threads is False:
-        threads_display = "1"
-    else:
-        threads_display = str(threads)
+    threads_display = "1" if threads is False else str(threads)
     logger.info(
         f"Optimized 7z settings: level={settings.level}, dict={settings.dictionary_size}, threads={threads_display}"
     )
     return settings
 
 
+def compress_many(
+    jobs: Sequence[tuple[Union[str, Path], Union[str, Path]]],
+    settings: Optional[SevenZipSettings] = None,
+) -> dict[Path, bool]:
+    """Compress several independent directories to 7z archives concurrently.
+
+    Many small archives finish sooner side by side than one after another with
+    more threads each, so when the settings use all cores the cores are split
+    evenly between the archives being built at the same time.
+
+    Args:
+        jobs: (source directory, archive path) pairs
+        settings: 7z compression settings shared by all archives
+
+    Returns:
+        Mapping of each archive path to whether its compression succeeded
+    """
+    job_list = [(Path(source), Path(archive)) for source, archive in jobs]
+    if not job_list:
+        return {}
+
+    settings = settings or SevenZipSettings()
+
+    # Reason: the work happens in 7zz subprocesses started by py7zz, so threads
+    # that just wait on them are enough to build archives in parallel
+    max_workers = min(_CPU_COUNT, len(job_list))
+    if settings.threads is True:
+        settings = settings.model_copy(
+            update={"threads": max(1, _CPU_COUNT // max_workers)}
+        )
+    logger.debug(
+        f"Compressing {len(job_list)} archives with {max_workers} workers "
+        f"(threads per archive: {settings.threads})"
+    )
+
+    compressor = SevenZipCompressor(settings)
+    results: dict[Path, bool] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(compressor.compress_directory, source, archive): archive
+            for source, archive in job_list
+        }
+        for future in as_completed(futures):
+            archive = futures[future]
+            try:
+                future.result()
+                results[archive] = True
+            except (CompressionError, OSError, ValueError) as e:
+                logger.error(f"7z compression failed for {archive.name}: {e}")
+                results[archive] = False
+
+    return results
+
+
 def get_7z_info(archive_path: Union[str, Path]) -> dict[str, Any]:
     """Get information about a 7z archive using py7zz API.
 
@@ -392,8 +403,11 @@ def get_7z_info(archive_path: Union[str, Path]) -> dict[str, Any]:
     """
     archive_obj = Path(archive_path)
 
-    if not archive_obj.exists():
-        raise FileNotFoundError(f"Archive not found: {archive_obj}")
+    # Reason: one stat both checks existence and provides the fallback size
+    try:
+        archive_size = os.stat(archive_obj).st_size
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Archive not found: {archive_obj}") from e
 
     try:
         logger.debug(f"Getting 7z archive info: {archive_obj}")
@@ -409,24 +423,28 @@ def get_7z_info(archive_path: Union[str, Path]) -> dict[str, Any]:
 
         try:
             with py7zz.SevenZipFile(str(archive_obj), "r") as archive:
-                file_list = archive.namelist()
-
-                if file_list:
-                    # Extract first-level items for structure analysis
-                    first_level_items = set()
-                    for item in file_list:
-                        normalized_path = item.replace("\\", "/")
-                        parts = normalized_path.split("/")
-                        if parts[0]:
-                            first_level_items.add(parts[0])
-
-                    # Check if archive has single root directory
-                    if len(first_level_items) == 1:
-                        root_name = next(iter(first_level_items))
-                        has_single_root = True
-                        logger.debug(f"Archive has single root directory: {root_name}")
-                    else:
-                        logger.debug(f"Archive has {len(first_level_items)} root items")
+                # Note: py7zz only exposes the listing as a complete list
+                # (namelist/infolist), so the names are consumed straight
+                # from it without keeping a reference around
+                for item in archive.namelist():
+                    if "\\" in item:
+                        item = item.replace("\\", "/")
+                    first_level = item.split("/", 1)[0]
+                    if not first_level:
+                        continue
+                    # Stop at the second distinct first-level item
+                    if root_name is None:
+                        root_name = first_level
+                    elif first_level != root_name:
+                        root_name = None
+                        break
+
+                # Check if archive has single root directory
+                if root_name is not None:
+                    has_single_root = True
+                    logger.debug(f"Archive has single root directory: {root_name}")
+                else:
+                    logger.debug("Archive has no single root directory")
         except Exception as e:
             logger.debug(f"Could not analyze archive structure: {e}")
             # Fallback: assume single root based on archive name
@@ -440,7 +458,7 @@ def get_7z_info(archive_path: Union[str, Path]) -> dict[str, Any]:
         return {
             "path": str(archive_obj),
             "format": ".7z",
-            "size": info.get("compressed_size", archive_obj.stat().st_size),
+            "size": info.get("compressed_size", archive_size),
             "file_count": info.get("file_count", 0),
             "uncompressed_size": info.get("uncompressed_size", 0),
             "compression_ratio": info.get("compression_ratio", 0.0),
@@ -452,6 +470,38 @@ def get_7z_info(archive_path: Union[str, Path]) -> dict[str, Any]:
         raise SevenZipError(f"Failed to get 7z archive info: {e}") from e
 
 
+def _test_7z_integrity(archive_path: Union[str, Path]) -> bool:
+    """Test 7z archive integrity with py7zz.
+
+    Args:
+        archive_path: Path to 7z archive
+
+    Returns:
+        True if archive is valid, False otherwise
+    """
+    archive_obj = Path(archive_path)
+
+    if not archive_obj.exists():
+        logger.warning(f"Archive not found for integrity test: {archive_obj.name}")
+        return False
+
+    try:
+        logger.debug(f"Testing 7z integrity: {archive_obj.name}")
+        # py7zz expects string paths
+        result = py7zz.test_archive(str(archive_obj))
+
+        if result:
+            logger.debug(f"7z integrity test passed: {archive_obj}")
+        else:
+            logger.warning(f"7z integrity test failed: {archive_obj.name}")
+
+        return bool(result)
+
+    except Exception as e:
+        logger.error(f"7z integrity test error: {e}")
+        return False
+
+
 def validate_7z_archive(archive_path: Union[str, Path]) -> bool:
     """Validate 7z archive integrity.
 
@@ -461,9 +511,59 @@ def validate_7z_archive(archive_path: Union[str, Path]) -> bool:
     Returns:
         True if archive is valid, False otherwise
     """
+    # Reason: integrity testing needs no compression settings, so skip building
+    # a SevenZipCompressor (and its settings) for every validated archive
     try:
-        compressor = SevenZipCompressor()
-        return compressor.test_integrity(archive_path)
+        return _test_7z_integrity(archive_path)
     except Exception as e:
         logger.debug(f"7z validation failed: {e}")
         return False
+
+
+def check_7z_headers(archive_path: Union[str, Path]) -> bool:
+    """Check 7z archive structure without decompressing any data.
+
+    Validates the signature, the start header CRC, that the next header lies
+    within the file, and the next header CRC. Only the first 32 bytes and the
+    trailing header are read, so the cost does not grow with archive size.
+    Use validate_7z_archive for a full integrity test.
+
+    Args:
+        archive_path: Path to 7z archive
+
+    Returns:
+        True if the archive headers are valid, False otherwise
+    """
+    archive_obj = Path(archive_path)
+
+    try:
+        with open(archive_obj, "rb") as f:
+            start = f.read(SEVENZ_SIGNATURE_HEADER_SIZE)
+            if (
+                len(start) < SEVENZ_SIGNATURE_HEADER_SIZE
+                or start[:6] != SEVENZ_SIGNATURE
+            ):
+                logger.debug(f"Not a 7z archive: {archive_obj.name}")
+                return False
+
+            (start_header_crc,) = struct.unpack_from("<I", start, 8)
+            if zlib.crc32(start[12:]) != start_header_crc:
+                logger.debug(f"7z start header CRC mismatch: {archive_obj.name}")
+                return False
+
+            next_offset, next_size, next_crc = struct.unpack_from("<QQI", start, 12)
+            next_start = SEVENZ_SIGNATURE_HEADER_SIZE + next_offset
+            if next_start + next_size > os.fstat(f.fileno()).st_size:
+                logger.debug(f"7z archive is truncated: {archive_obj.name}")
+                return False
+
+            f.seek(next_start)
+            if zlib.crc32(f.read(next_size)) != next_crc:
+                logger.debug(f"7z next header CRC mismatch: {archive_obj.name}")
+                return False
+
+        return True
+
+    except OSError as e:
+        logger.debug(f"7z header check failed: {e}")
+        return False
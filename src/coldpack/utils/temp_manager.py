@@ -35,6 +35,47 @@ class WindowsTempCleanupError(Exception):
     pass
 
 
+def _fast_rmtree(path: Union[str, Path]) -> None:
+    """Remove a directory tree created by this module.
+
+    Unlike ``shutil.rmtree``, entries are classified from the directory
+    listing alone, so no ``lstat`` is issued before each unlink. On Windows
+    the tree is removed with ``shutil.rmtree`` instead.
+
+    Args:
+        path: Root of the directory tree to remove
+
+    Raises:
+        OSError: If any entry cannot be removed
+    """
+    # Reason: before Python 3.12, DirEntry.is_dir(follow_symlinks=False) is
+    # True for NTFS junctions, so the walk below would descend into a junction
+    # in extracted (untrusted) contents and empty its target; shutil.rmtree
+    # detects junctions and removes only the link
+    if platform.system().lower() == "windows":
+        shutil.rmtree(path)
+        return
+
+    # Reason: on POSIX, is_dir(follow_symlinks=False) is False for symlinks, so
+    # links are unlinked and never followed; the 0700 root created by this
+    # module keeps other users from swapping entries during the walk, so the
+    # symlink-race protection of shutil's fd-based walk is not needed here
+    stack: list[tuple[str, bool]] = [(os.fspath(path), False)]
+    while stack:
+        current, emptied = stack.pop()
+        if emptied:
+            os.rmdir(current)
+            continue
+
+        stack.append((current, True))
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, False))
+                else:
+                    os.unlink(entry.path)
+
+
 class GlobalTempManager:
     """Global manager for temporary files and directories with safe cleanup.
 
@@ -120,15 +161,9 @@ class GlobalTempManager:
             OSError: If directory creation fails
         """
         try:
-            temp_dir = tempfile.mkdtemp(suffix=suffix, prefix=prefix)
-            temp_path = Path(temp_dir)
-
-            # Set secure permissions (owner only)
-            if not self._is_windows:
-                os.chmod(temp_path, 0o700)
-            else:
-                # On Windows, rely on default NTFS permissions
-                pass
+            # Reason: mkdtemp already creates the directory with mode 0700
+            # (owner only), so no follow-up chmod is needed
+            temp_path = Path(tempfile.mkdtemp(suffix=suffix, prefix=prefix))
 
             if auto_cleanup:
                 with self._lock:
@@ -308,8 +343,11 @@ class GlobalTempManager:
             return True
 
         try:
-            # Try normal removal first
-            shutil.rmtree(dir_path)
+            # Try normal removal first, falling back to shutil for odd entries
+            try:
+                _fast_rmtree(dir_path)
+            except OSError:
+                shutil.rmtree(dir_path)
             logger.debug(f"Successfully removed temporary directory: {dir_path}")
             return True
 
@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2025 coldpack contributors
+# SPDX-License-Identifier: MIT
+
+"""Shared fixtures for the coldpack test suite."""
+
+import os
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Make Rich render plain text for the whole test session.
+
+    The CLI console is created when coldpack.cli is first imported during
+    collection, so the environment has to be set before that happens.
+    """
+    # Reason: TERM=dumb disables Rich's color system even with force_terminal,
+    # so no escape codes reach CliRunner output; NO_COLOR covers other tools
+    os.environ["NO_COLOR"] = "1"
+    os.environ["TERM"] = "dumb"
+
+
+@pytest.fixture(scope="module")
+def runner() -> CliRunner:
+    """Create a CLI test runner shared by the tests in a module."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="module")
+def temp_source_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create temporary source directory with test files.
+
+    Built once per test module. Tests must only read from it; a test that
+    needs to modify the tree should copy it into its own tmp_path first.
+    """
+    temp_path = tmp_path_factory.mktemp("source")
+
+    # Create test files, including one in a subdirectory
+    for name, content in (
+        ("file1.txt", b"test content 1"),
+        ("file2.txt", b"test content 2"),
+        ("subdir/nested.txt", b"nested content"),
+    ):
+        file_path = temp_path / name
+        file_path.parent.mkdir(exist_ok=True)
+        file_path.write_bytes(content)
+
+    return temp_path
+
+
+@pytest.fixture(scope="session")
+def dummy_7z_archive(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a placeholder .7z file for tests that mock the archive handlers.
+
+    Only the path matters to these tests; the contents are never parsed.
+    """
+    archive_path = tmp_path_factory.mktemp("archives") / "dummy.7z"
+    archive_path.write_bytes(b"dummy archive content")
+    return archive_path
+
+
+@pytest.fixture(scope="session")
+def dummy_par2_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a placeholder .par2 file for tests that mock the repairer."""
+    par2_path = tmp_path_factory.mktemp("recovery") / "dummy.par2"
+    par2_path.write_bytes(b"dummy par2 content")
+    return par2_path
@@ -3,27 +3,43 @@
 
 """Tests for coldpack CLI interface."""
 
-import os
-import tempfile
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock, patch
 
 import pytest
 import typer
-from typer.testing import CliRunner
 
-from coldpack.cli import app, get_global_options, setup_logging, version_callback
+from coldpack.cli import (
+    _load_coldpack_metadata,
+    _validate_memory_limit,
+    _validate_verify_flags,
+    app,
+    display_archive_summary,
+    display_par2_info,
+    get_global_options,
+    setup_logging,
+    version_callback,
+)
 from coldpack.config.constants import ExitCodes
+from coldpack.config.settings import (
+    ArchiveMetadata,
+    PAR2Settings,
+    ProcessingOptions,
+    SevenZipSettings,
+)
+from coldpack.core.archiver import ArchiveResult, ColdStorageArchiver
+from coldpack.core.extractor import MultiFormatExtractor
+from coldpack.core.lister import ArchiveLister
+from coldpack.core.repairer import ArchiveRepairer, RepairResult
+from coldpack.core.verifier import ArchiveVerifier, VerificationResult
+from coldpack.utils.filesystem import safe_file_operations
+from coldpack.utils.par2 import PAR2Manager
+from coldpack.utils.sevenzip import SevenZipCompressor
 
 
 class TestCLIBasics:
     """Test basic CLI functionality."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create CLI test runner."""
-        return CliRunner()
-
     def test_version_callback(self):
         """Test version callback function."""
         with pytest.raises(typer.Exit):
@@ -41,51 +57,63 @@ class TestCLIBasics:
         assert "coldpack" in result.stdout
         assert "Cross-platform cold storage CLI" in result.stdout
 
+    @pytest.mark.parametrize(
+        "command, needle",
+        [
+            ("create", "Create a cold storage 7z archive"),
+            ("extract", "Extract"),
+            ("list", "List"),
+            ("verify", "Verify"),
+            ("repair", "Repair"),
+            ("info", "Show"),
+        ],
+    )
+    def test_subcommand_help(self, runner, command, needle):
+        """Test that each subcommand prints its help text."""
+        result = runner.invoke(app, [command, "--help"])
+        assert result.exit_code == 0
+        assert needle in result.stdout
+
     def test_version_option(self, runner):
         """Test --version option."""
         result = runner.invoke(app, ["--version"])
         assert result.exit_code == 0
         assert "coldpack version" in result.stdout
 
-    def test_verbose_and_quiet_conflict(self, runner):
+    def test_verbose_and_quiet_conflict(self, runner, tmp_path):
         """Test that verbose and quiet cannot be used together."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            result = runner.invoke(app, ["--verbose", "--quiet", "create", temp_dir])
-            assert result.exit_code == 1
-            assert "cannot be used together" in result.stdout
+        result = runner.invoke(app, ["--verbose", "--quiet", "create", str(tmp_path)])
+        assert result.exit_code == 1
+        assert "cannot be used together" in result.stdout
+
+    @pytest.mark.parametrize(
+        "command, path, message",
+        [
+            ("create", "/nonexistent/path", "Source not found"),
+            ("extract", "/nonexistent/archive.7z", "Archive not found"),
+            ("list", "/nonexistent/archive.7z", "Archive not found"),
+            ("verify", "/nonexistent/archive.7z", "Archive not found"),
+            ("repair", "/nonexistent/archive.7z", "File not found"),
+            ("info", "/nonexistent/archive.7z", "File not found"),
+        ],
+    )
+    def test_nonexistent_input(self, runner, command, path, message):
+        """Test every command reports a missing input file."""
+        result = runner.invoke(app, [command, path])
+        assert result.exit_code == ExitCodes.FILE_NOT_FOUND
+        assert message in result.stdout
 
 
 class TestLoggingSetup:
     """Test logging configuration."""
 
-    @patch("coldpack.cli.logger")
-    def test_setup_logging_default(self, mock_logger):
-        """Test default logging setup."""
-        setup_logging(verbose=False, quiet=False)
-
-        # Should remove default handler and add new one
-        mock_logger.remove.assert_called_once()
-        mock_logger.add.assert_called_once()
-
-        # Check call arguments
-        call_args = mock_logger.add.call_args
-        assert call_args[1]["level"] == "INFO"
-
-    @patch("coldpack.cli.logger")
-    def test_setup_logging_verbose(self, mock_logger):
-        """Test verbose logging setup."""
-        setup_logging(verbose=True, quiet=False)
-
-        call_args = mock_logger.add.call_args
-        assert call_args[1]["level"] == "DEBUG"
-
-    @patch("coldpack.cli.logger")
-    def test_setup_logging_quiet(self, mock_logger):
-        """Test quiet logging setup."""
-        setup_logging(verbose=False, quiet=True)
-
-        call_args = mock_logger.add.call_args
-        assert call_args[1]["level"] == "WARNING"
+    @pytest.mark.parametrize(
+        ("verbose", "quiet", "expected"),
+        [(False, False, "INFO"), (True, False, "DEBUG"), (False, True, "WARNING")],
+    )
+    def test_setup_logging_level(self, verbose, quiet, expected):
+        """Test that the handler level follows the verbose and quiet flags."""
+        assert setup_logging(verbose=verbose, quiet=quiet) == expected
 
 
 class TestGlobalOptions:
@@ -93,7 +121,7 @@ class TestGlobalOptions:
 
     def test_get_global_options_no_context(self):
         """Test getting options when context is None."""
-        ctx = MagicMock()
+        ctx = Mock(spec=typer.Context)
         ctx.obj = None
 
         verbose, quiet = get_global_options(ctx)
@@ -102,7 +130,7 @@ class TestGlobalOptions:
 
     def test_get_global_options_with_context(self):
         """Test getting options from context."""
-        ctx = MagicMock()
+        ctx = Mock(spec=typer.Context)
         ctx.obj = {"verbose": True, "quiet": False}
 
         verbose, quiet = get_global_options(ctx)
@@ -111,7 +139,7 @@ class TestGlobalOptions:
 
     def test_get_global_options_partial_context(self):
         """Test getting options with partial context."""
-        ctx = MagicMock()
+        ctx = Mock(spec=typer.Context)
         ctx.obj = {"verbose": True}  # Missing quiet
 
         verbose, quiet = get_global_options(ctx)
@@ -122,51 +150,11 @@ class TestGlobalOptions:
 class TestCreateCommand:
     """Test create command functionality."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create CLI test runner."""
-        return CliRunner()
-
-    @pytest.fixture
-    def temp_source_dir(self):
-        """Create temporary source directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create test files
-            (temp_path / "file1.txt").write_text("test content 1")
-            (temp_path / "file2.txt").write_text("test content 2")
-
-            # Create subdirectory
-            subdir = temp_path / "subdir"
-            subdir.mkdir()
-            (subdir / "nested.txt").write_text("nested content")
-
-            yield temp_path
-
-    def test_create_help(self, runner):
-        """Test create command help."""
-        result = runner.invoke(app, ["create", "--help"])
-        assert result.exit_code == 0
-        assert "Create a cold storage 7z archive" in result.stdout
-
-    def test_create_nonexistent_source(self, runner):
-        """Test create with non-existent source."""
-        result = runner.invoke(app, ["create", "/nonexistent/path"])
-        assert result.exit_code == ExitCodes.FILE_NOT_FOUND
-        assert "Source not found" in result.stdout
-
     def test_create_invalid_compression_level(self, runner, temp_source_dir):
         """Test create with invalid compression level."""
         result = runner.invoke(app, ["create", str(temp_source_dir), "--level", "10"])
         assert result.exit_code == ExitCodes.INVALID_FORMAT
-        # Remove ANSI color codes for assertion
-        clean_output = (
-            result.stdout.replace("\x1b[31m", "")
-            .replace("\x1b[0m", "")
-            .replace("\x1b[1;31m", "")
-        )
-        assert "level must be between 0 and 9" in clean_output
+        assert "level must be between 0 and 9" in result.stdout
 
     def test_create_invalid_dict_size(self, runner, temp_source_dir):
         """Test create with invalid dictionary size."""
@@ -195,16 +183,14 @@ class TestCreateCommand:
     @patch("coldpack.cli.ColdStorageArchiver")
     @patch("coldpack.cli.check_par2_availability")
     def test_create_success_basic(
-        self, mock_par2_check, mock_archiver, runner, temp_source_dir
+        self, mock_par2_check, mock_archiver, runner, temp_source_dir, tmp_path
     ):
         """Test successful basic archive creation."""
-        from coldpack.core.archiver import ArchiveResult
-
         # Mock PAR2 as available
         mock_par2_check.return_value = True
 
         # Mock archiver
-        mock_archiver_instance = MagicMock()
+        mock_archiver_instance = Mock(spec=ColdStorageArchiver)
         mock_archiver.return_value = mock_archiver_instance
 
         # Create a successful ArchiveResult
@@ -213,38 +199,35 @@ class TestCreateCommand:
         )
         mock_archiver_instance.create_archive.return_value = success_result
 
-        with tempfile.TemporaryDirectory() as output_dir:
-            result = runner.invoke(
-                app,
-                [
-                    "create",
-                    str(temp_source_dir),
-                    "--output-dir",
-                    output_dir,
-                    "--name",
-                    "test_archive",
-                ],
-            )
+        result = runner.invoke(
+            app,
+            [
+                "create",
+                str(temp_source_dir),
+                "--output-dir",
+                str(tmp_path),
+                "--name",
+                "test_archive",
+            ],
+        )
 
-            # Should succeed (exit code 0)
-            assert result.exit_code == 0
+        # Should succeed (exit code 0)
+        assert result.exit_code == 0
 
-            # Verify archiver was called
-            mock_archiver.assert_called_once()
-            mock_archiver_instance.create_archive.assert_called_once()
+        # Verify archiver was called
+        mock_archiver.assert_called_once()
+        mock_archiver_instance.create_archive.assert_called_once()
 
     @patch("coldpack.cli.check_par2_availability")
     def test_create_par2_unavailable_warning(
-        self, mock_par2_check, runner, temp_source_dir
+        self, mock_par2_check, runner, temp_source_dir, tmp_path
     ):
         """Test create command when PAR2 is unavailable."""
-        from coldpack.core.archiver import ArchiveResult
-
         # Mock PAR2 as unavailable
         mock_par2_check.return_value = False
 
         with patch("coldpack.cli.ColdStorageArchiver") as mock_archiver:
-            mock_archiver_instance = MagicMock()
+            mock_archiver_instance = Mock(spec=ColdStorageArchiver)
             mock_archiver.return_value = mock_archiver_instance
 
             # Create a successful ArchiveResult
@@ -253,28 +236,25 @@ class TestCreateCommand:
             )
             mock_archiver_instance.create_archive.return_value = success_result
 
-            with tempfile.TemporaryDirectory() as output_dir:
-                result = runner.invoke(
-                    app, ["create", str(temp_source_dir), "--output-dir", output_dir]
-                )
+            result = runner.invoke(
+                app, ["create", str(temp_source_dir), "--output-dir", str(tmp_path)]
+            )
 
-                # Should still succeed but with warning
-                assert result.exit_code == 0
-                assert "PAR2 tools not found" in result.stdout
+            # Should still succeed but with warning
+            assert result.exit_code == 0
+            assert "PAR2 tools not found" in result.stdout
 
     @patch("coldpack.cli.ColdStorageArchiver")
     @patch("coldpack.cli.check_par2_availability")
     def test_create_with_memory_limit(
-        self, mock_par2_check, mock_archiver, runner, temp_source_dir
+        self, mock_par2_check, mock_archiver, runner, temp_source_dir, tmp_path
     ):
         """Test create command with memory_limit parameter."""
-        from coldpack.core.archiver import ArchiveResult
-
         # Mock PAR2 as available
         mock_par2_check.return_value = True
 
         # Mock archiver
-        mock_archiver_instance = MagicMock()
+        mock_archiver_instance = Mock(spec=ColdStorageArchiver)
         mock_archiver.return_value = mock_archiver_instance
 
         # Create a successful ArchiveResult
@@ -283,36 +263,33 @@ class TestCreateCommand:
         )
         mock_archiver_instance.create_archive.return_value = success_result
 
-        with tempfile.TemporaryDirectory() as output_dir:
-            result = runner.invoke(
-                app,
-                [
-                    "create",
-                    str(temp_source_dir),
-                    "--output-dir",
-                    output_dir,
-                    "--memory-limit",
-                    "512m",
-                ],
-            )
+        result = runner.invoke(
+            app,
+            [
+                "create",
+                str(temp_source_dir),
+                "--output-dir",
+                str(tmp_path),
+                "--memory-limit",
+                "512m",
+            ],
+        )
 
-            # Should succeed
-            assert result.exit_code == 0
-            mock_archiver_instance.create_archive.assert_called_once()
+        # Should succeed
+        assert result.exit_code == 0
+        mock_archiver_instance.create_archive.assert_called_once()
 
     @patch("coldpack.cli.ColdStorageArchiver")
     @patch("coldpack.cli.check_par2_availability")
     def test_create_with_memory_limit_and_compression_params(
-        self, mock_par2_check, mock_archiver, runner, temp_source_dir
+        self, mock_par2_check, mock_archiver, runner, temp_source_dir, tmp_path
     ):
         """Test create command with memory_limit and other compression parameters."""
-        from coldpack.core.archiver import ArchiveResult
-
         # Mock PAR2 as available
         mock_par2_check.return_value = True
 
         # Mock archiver
-        mock_archiver_instance = MagicMock()
+        mock_archiver_instance = Mock(spec=ColdStorageArchiver)
         mock_archiver.return_value = mock_archiver_instance
 
         # Create a successful ArchiveResult
@@ -321,28 +298,27 @@ class TestCreateCommand:
         )
         mock_archiver_instance.create_archive.return_value = success_result
 
-        with tempfile.TemporaryDirectory() as output_dir:
-            result = runner.invoke(
-                app,
-                [
-                    "create",
-                    str(temp_source_dir),
-                    "--output-dir",
-                    output_dir,
-                    "--level",
-                    "9",
-                    "--dict",
-                    "256m",
-                    "--memory-limit",
-                    "2g",
-                    "--threads",
-                    "8",
-                ],
-            )
+        result = runner.invoke(
+            app,
+            [
+                "create",
+                str(temp_source_dir),
+                "--output-dir",
+                str(tmp_path),
+                "--level",
+                "9",
+                "--dict",
+                "256m",
+                "--memory-limit",
+                "2g",
+                "--threads",
+                "8",
+            ],
+        )
 
-            # Should succeed
-            assert result.exit_code == 0
-            mock_archiver_instance.create_archive.assert_called_once()
+        # Should succeed
+        assert result.exit_code == 0
+        mock_archiver_instance.create_archive.assert_called_once()
 
     def test_create_invalid_memory_limit_format(self, runner, temp_source_dir):
         """Test create with invalid memory_limit format."""
@@ -350,128 +326,77 @@ class TestCreateCommand:
             app, ["create", str(temp_source_dir), "--memory-limit", "invalid"]
         )
         assert result.exit_code == ExitCodes.INVALID_FORMAT
-        # Remove ANSI color codes for assertion
-        clean_output = (
-            result.stdout.replace("\x1b[31m", "")
-            .replace("\x1b[0m", "")
-            .replace("\x1b[1;31m", "")
-        )
-        assert "memory-limit must be in format" in clean_output
-
-    def test_create_invalid_memory_limit_zero(self, runner, temp_source_dir):
-        """Test create with zero memory_limit."""
-        result = runner.invoke(
-            app, ["create", str(temp_source_dir), "--memory-limit", "0m"]
-        )
-        assert result.exit_code == ExitCodes.INVALID_FORMAT
-        # Remove ANSI color codes for assertion
-        clean_output = (
-            result.stdout.replace("\x1b[31m", "")
-            .replace("\x1b[0m", "")
-            .replace("\x1b[1;31m", "")
-        )
-        assert "memory-limit must be a positive number" in clean_output
-
-    def test_create_invalid_memory_limit_exceeds_64gb(self, runner, temp_source_dir):
-        """Test create with memory_limit exceeding 64GB."""
-        result = runner.invoke(
-            app, ["create", str(temp_source_dir), "--memory-limit", "65g"]
-        )
-        assert result.exit_code == ExitCodes.INVALID_FORMAT
-        # Remove ANSI color codes for assertion
-        clean_output = (
-            result.stdout.replace("\x1b[31m", "")
-            .replace("\x1b[0m", "")
-            .replace("\x1b[1;31m", "")
-        )
-        assert "memory-limit cannot exceed 64GB" in clean_output
-
-    def test_create_memory_limit_valid_formats(self, runner, temp_source_dir):
-        """Test create with various valid memory_limit formats."""
-        from coldpack.core.archiver import ArchiveResult
-
-        valid_formats = ["1g", "512m", "256k", "1024"]
-
-        with (
-            patch("coldpack.cli.ColdStorageArchiver") as mock_archiver,
-            patch("coldpack.cli.check_par2_availability") as mock_par2_check,
-        ):
-            # Mock PAR2 as available
-            mock_par2_check.return_value = True
-
-            # Mock archiver
-            mock_archiver_instance = MagicMock()
-            mock_archiver.return_value = mock_archiver_instance
-
-            # Create a successful ArchiveResult
-            success_result = ArchiveResult(
-                success=True,
-                message="Archive created successfully",
-                created_files=[],
-            )
-            mock_archiver_instance.create_archive.return_value = success_result
-
-            for memory_format in valid_formats:
-                with tempfile.TemporaryDirectory() as output_dir:
-                    result = runner.invoke(
-                        app,
-                        [
-                            "create",
-                            str(temp_source_dir),
-                            "--output-dir",
-                            output_dir,
-                            "--memory-limit",
-                            memory_format,
-                        ],
-                    )
-
-                    # Should succeed for all valid formats
-                    assert result.exit_code == 0, f"Failed for format: {memory_format}"
-
-    def test_create_memory_limit_boundary_64gb(self, runner, temp_source_dir):
-        """Test create with memory_limit exactly at 64GB boundary."""
-        from coldpack.core.archiver import ArchiveResult
-
-        with (
-            patch("coldpack.cli.ColdStorageArchiver") as mock_archiver,
-            patch("coldpack.cli.check_par2_availability") as mock_par2_check,
-        ):
-            # Mock PAR2 as available
-            mock_par2_check.return_value = True
-
-            # Mock archiver
-            mock_archiver_instance = MagicMock()
-            mock_archiver.return_value = mock_archiver_instance
-
-            # Create a successful ArchiveResult
-            success_result = ArchiveResult(
-                success=True,
-                message="Archive created successfully",
-                created_files=[],
-            )
-            mock_archiver_instance.create_archive.return_value = success_result
-
-            with tempfile.TemporaryDirectory() as output_dir:
-                # Test exactly 64GB should succeed
-                result = runner.invoke(
-                    app,
-                    [
-                        "create",
-                        str(temp_source_dir),
-                        "--output-dir",
-                        output_dir,
-                        "--memory-limit",
-                        "64g",
-                    ],
-                )
-                assert result.exit_code == 0
-
-    def test_create_memory_limit_case_insensitive(self, runner, temp_source_dir):
-        """Test create with memory_limit case variations."""
-        from coldpack.core.archiver import ArchiveResult
-
-        case_formats = ["1G", "512M", "256K", "1g", "512m", "256k"]
-
+        assert "memory-limit must be in format" in result.stdout
+
+    @pytest.mark.parametrize(
+        "memory_limit, message",
+        [
+            ("0m", "memory-limit must be a positive number"),
+            ("65g", "memory-limit cannot exceed 64GB"),
+            # Whitespace is not stripped
+            (" 1g", "memory-limit must be in format"),
+            ("1g ", "memory-limit must be in format"),
+            (" 1g ", "memory-limit must be in format"),
+            ("1 g", "memory-limit must be in format"),
+            # Decimal values are not accepted
+            ("1.5g", "memory-limit must be in format"),
+            ("512.5m", "memory-limit must be in format"),
+            ("0.5g", "memory-limit must be in format"),
+        ],
+    )
+    def test_validate_memory_limit_invalid(self, capsys, memory_limit, message):
+        """Test memory_limit validation rejects bad values without invoking the CLI."""
+        with pytest.raises(typer.Exit) as exc_info:
+            _validate_memory_limit(memory_limit)
+
+        assert exc_info.value.exit_code == ExitCodes.INVALID_FORMAT
+        assert message in capsys.readouterr().out
+
+    @pytest.mark.parametrize(
+        "memory_limit",
+        # Valid formats, the exact 64GB boundary and case variations
+        ["1g", "512m", "256k", "1024", "64g", "1G", "512M", "256K"],
+    )
+    def test_validate_memory_limit_valid(self, memory_limit):
+        """Test memory_limit validation accepts valid values."""
+        _validate_memory_limit(memory_limit)
+
+    @pytest.mark.parametrize(
+        "flags",
+        [
+            {"no_verify_7z": True},
+            {"no_verify_sha256": True},
+            {"no_verify_blake3": True},
+            {"no_verify_par2": True},
+        ],
+    )
+    def test_validate_verify_flags_conflict(self, flags):
+        """Test --no-verify is rejected together with each --no-verify-* option."""
+        options = {
+            "no_verify": True,
+            "no_verify_7z": False,
+            "no_verify_sha256": False,
+            "no_verify_blake3": False,
+            "no_verify_par2": False,
+            **flags,
+        }
+
+        with pytest.raises(typer.Exit) as exc_info:
+            _validate_verify_flags(**options)
+
+        assert exc_info.value.exit_code == 1
+
+    @pytest.mark.parametrize(
+        "no_verify, individual", [(True, False), (False, True), (False, False)]
+    )
+    def test_validate_verify_flags_allowed(self, no_verify, individual):
+        """Test --no-verify alone or individual --no-verify-* options are allowed."""
+        _validate_verify_flags(no_verify, *[individual] * 4)
+
+    def test_create_memory_limit_with_verbose_output(
+        self, runner, temp_source_dir, tmp_path
+    ):
+        """Test create with memory_limit and verbose output."""
         with (
             patch("coldpack.cli.ColdStorageArchiver") as mock_archiver,
             patch("coldpack.cli.check_par2_availability") as mock_par2_check,
@@ -480,7 +405,7 @@ class TestCreateCommand:
             mock_par2_check.return_value = True
 
             # Mock archiver
-            mock_archiver_instance = MagicMock()
+            mock_archiver_instance = Mock(spec=ColdStorageArchiver)
             mock_archiver.return_value = mock_archiver_instance
 
             # Create a successful ArchiveResult
@@ -491,436 +416,218 @@ class TestCreateCommand:
             )
             mock_archiver_instance.create_archive.return_value = success_result
 
-            for memory_format in case_formats:
-                with tempfile.TemporaryDirectory() as output_dir:
-                    result = runner.invoke(
-                        app,
-                        [
-                            "create",
-                            str(temp_source_dir),
-                            "--output-dir",
-                            output_dir,
-                            "--memory-limit",
-                            memory_format,
-                        ],
-                    )
-
-                    # Should succeed for all case variations
-                    assert result.exit_code == 0, f"Failed for format: {memory_format}"
-
-    def test_create_memory_limit_with_whitespace(self, runner, temp_source_dir):
-        """Test create with memory_limit containing whitespace (should fail)."""
-        whitespace_formats = [" 1g", "1g ", " 1g ", "1 g"]
-
-        for memory_format in whitespace_formats:
-            result = runner.invoke(
-                app, ["create", str(temp_source_dir), "--memory-limit", memory_format]
-            )
-            assert result.exit_code == ExitCodes.INVALID_FORMAT
-            # Remove ANSI color codes for assertion
-            clean_output = (
-                result.stdout.replace("\x1b[31m", "")
-                .replace("\x1b[0m", "")
-                .replace("\x1b[1;31m", "")
-            )
-            assert "memory-limit must be in format" in clean_output
-
-    def test_create_memory_limit_decimal_values(self, runner, temp_source_dir):
-        """Test create with decimal memory_limit values (should fail)."""
-        decimal_formats = ["1.5g", "512.5m", "0.5g"]
-
-        for memory_format in decimal_formats:
             result = runner.invoke(
-                app, ["create", str(temp_source_dir), "--memory-limit", memory_format]
-            )
-            assert result.exit_code == ExitCodes.INVALID_FORMAT
-            # Remove ANSI color codes for assertion
-            clean_output = (
-                result.stdout.replace("\x1b[31m", "")
-                .replace("\x1b[0m", "")
-                .replace("\x1b[1;31m", "")
-            )
-            assert "memory-limit must be in format" in clean_output
-
-    def test_create_memory_limit_with_verbose_output(self, runner, temp_source_dir):
-        """Test create with memory_limit and verbose output."""
-        from coldpack.core.archiver import ArchiveResult
-
-        with (
-            patch("coldpack.cli.ColdStorageArchiver") as mock_archiver,
-            patch("coldpack.cli.check_par2_availability") as mock_par2_check,
-        ):
-            # Mock PAR2 as available
-            mock_par2_check.return_value = True
-
-            # Mock archiver
-            mock_archiver_instance = MagicMock()
-            mock_archiver.return_value = mock_archiver_instance
-
-            # Create a successful ArchiveResult
-            success_result = ArchiveResult(
-                success=True,
-                message="Archive created successfully",
-                created_files=[],
+                app,
+                [
+                    "create",
+                    str(temp_source_dir),
+                    "--output-dir",
+                    str(tmp_path),
+                    "--memory-limit",
+                    "1g",
+                    "--verbose",
+                ],
             )
-            mock_archiver_instance.create_archive.return_value = success_result
 
-            with tempfile.TemporaryDirectory() as output_dir:
-                result = runner.invoke(
-                    app,
-                    [
-                        "create",
-                        str(temp_source_dir),
-                        "--output-dir",
-                        output_dir,
-                        "--memory-limit",
-                        "1g",
-                        "--verbose",
-                    ],
-                )
-
-                # Should succeed and show verbose output
-                assert result.exit_code == 0
-                # Verbose flag should be properly handled with memory_limit
+            # Should succeed and show verbose output
+            assert result.exit_code == 0
+            # Verbose flag should be properly handled with memory_limit
 
 
 class TestExtractCommand:
     """Test extract command functionality."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create CLI test runner."""
-        return CliRunner()
-
-    def test_extract_help(self, runner):
-        """Test extract command help."""
-        result = runner.invoke(app, ["extract", "--help"])
-        assert result.exit_code == 0
-        assert "Extract" in result.stdout
-
-    def test_extract_nonexistent_archive(self, runner):
-        """Test extract with non-existent archive."""
-        result = runner.invoke(app, ["extract", "/nonexistent/archive.7z"])
-        assert result.exit_code == ExitCodes.FILE_NOT_FOUND
-        assert "Archive not found" in result.stdout
-
     @patch("coldpack.cli.MultiFormatExtractor")
-    def test_extract_success(self, mock_extractor, runner):
+    def test_extract_success(self, mock_extractor, runner, dummy_7z_archive, tmp_path):
         """Test successful extraction."""
-        # Create temporary archive file
-        with tempfile.NamedTemporaryFile(suffix=".7z", delete=False) as tmp_archive:
-            archive_path = tmp_archive.name
-            tmp_archive.write(b"dummy archive content")
+        archive_path = str(dummy_7z_archive)
 
-        try:
-            # Mock extractor
-            mock_extractor_instance = MagicMock()
-            mock_extractor.return_value = mock_extractor_instance
+        # Mock extractor
+        mock_extractor_instance = Mock(spec=MultiFormatExtractor)
+        mock_extractor.return_value = mock_extractor_instance
 
-            with tempfile.TemporaryDirectory() as output_dir:
-                result = runner.invoke(
-                    app, ["extract", archive_path, "--output-dir", output_dir]
-                )
+        result = runner.invoke(
+            app, ["extract", archive_path, "--output-dir", str(tmp_path)]
+        )
 
-                # Should succeed
-                assert result.exit_code == 0
-                mock_extractor_instance.extract.assert_called_once()
-        finally:
-            # Cleanup
-            os.unlink(archive_path)
+        # Should succeed
+        assert result.exit_code == 0
+        mock_extractor_instance.extract.assert_called_once()
 
 
 class TestListCommand:
     """Test list command functionality."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create CLI test runner."""
-        return CliRunner()
-
-    def test_list_help(self, runner):
-        """Test list command help."""
-        result = runner.invoke(app, ["list", "--help"])
-        assert result.exit_code == 0
-        assert "List" in result.stdout
-
-    def test_list_nonexistent_archive(self, runner):
-        """Test list with non-existent archive."""
-        result = runner.invoke(app, ["list", "/nonexistent/archive.7z"])
-        assert result.exit_code == ExitCodes.FILE_NOT_FOUND
-        assert "Archive not found" in result.stdout
-
     @patch("coldpack.cli.ArchiveLister")
-    def test_list_success(self, mock_lister, runner):
+    def test_list_success(self, mock_lister, runner, dummy_7z_archive):
         """Test successful archive listing."""
-        # Create temporary archive file
-        with tempfile.NamedTemporaryFile(suffix=".7z", delete=False) as tmp_archive:
-            archive_path = tmp_archive.name
-            tmp_archive.write(b"dummy archive content")
-
-        try:
-            # Mock lister
-            mock_lister_instance = MagicMock()
-            mock_lister.return_value = mock_lister_instance
-
-            # Create complete mock result with all required fields
-            mock_lister_instance.list_archive.return_value = {
-                "archive_path": archive_path,
-                "format": ".7z",
-                "total_files": 2,
-                "total_directories": 1,
-                "total_entries": 3,
-                "total_size": 1024,
-                "total_compressed_size": 512,
-                "compression_ratio": 50.0,
-                "showing_range": "All 3 entries",
-                "has_more": False,
-                "files": [],
-            }
-
-            result = runner.invoke(app, ["list", archive_path])
-
-            # Should succeed
-            assert result.exit_code == 0
-            mock_lister_instance.list_archive.assert_called_once()
-        finally:
-            # Cleanup
-            os.unlink(archive_path)
+        archive_path = str(dummy_7z_archive)
+
+        # Mock lister
+        mock_lister_instance = Mock(spec=ArchiveLister)
+        mock_lister.return_value = mock_lister_instance
+
+        # Create complete mock result with all required fields
+        mock_lister_instance.list_archive.return_value = {
+            "archive_path": archive_path,
+            "format": ".7z",
+            "total_files": 2,
+            "total_directories": 1,
+            "total_entries": 3,
+            "total_size": 1024,
+            "total_compressed_size": 512,
+            "compression_ratio": 50.0,
+            "showing_range": "All 3 entries",
+            "has_more": False,
+            "files": [],
+        }
+
+        result = runner.invoke(app, ["list", archive_path])
+
+        # Should succeed
+        assert result.exit_code == 0
+        mock_lister_instance.list_archive.assert_called_once()
 
 
 class TestVerifyCommand:
     """Test verify command functionality."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create CLI test runner."""
-        return CliRunner()
-
-    def test_verify_help(self, runner):
-        """Test verify command help."""
-        result = runner.invoke(app, ["verify", "--help"])
-        assert result.exit_code == 0
-        assert "Verify" in result.stdout
-
-    def test_verify_nonexistent_archive(self, runner):
-        """Test verify with non-existent archive."""
-        result = runner.invoke(app, ["verify", "/nonexistent/archive.7z"])
-        assert result.exit_code == ExitCodes.FILE_NOT_FOUND
-        assert "Archive not found" in result.stdout
-
     @patch("coldpack.cli.ArchiveVerifier")
-    def test_verify_success(self, mock_verifier, runner):
+    def test_verify_success(self, mock_verifier, runner, dummy_7z_archive):
         """Test successful verification."""
-        # Create temporary archive file
-        with tempfile.NamedTemporaryFile(suffix=".7z", delete=False) as tmp_archive:
-            archive_path = tmp_archive.name
-            tmp_archive.write(b"dummy archive content")
-
-        try:
-            # Mock verifier
-            mock_verifier_instance = MagicMock()
-            mock_verifier.return_value = mock_verifier_instance
+        archive_path = str(dummy_7z_archive)
 
-            # Mock successful verification results
-            from coldpack.core.verifier import VerificationResult
+        # Mock verifier
+        mock_verifier_instance = Mock(spec=ArchiveVerifier)
+        mock_verifier.return_value = mock_verifier_instance
 
-            successful_result = VerificationResult(
-                layer="7z_integrity", success=True, message="Verification passed"
-            )
-            mock_verifier_instance.verify_auto.return_value = [successful_result]
+        # Mock successful verification results
+        successful_result = VerificationResult(
+            layer="7z_integrity", success=True, message="Verification passed"
+        )
+        mock_verifier_instance.verify_auto.return_value = [successful_result]
 
-            result = runner.invoke(app, ["verify", archive_path])
+        result = runner.invoke(app, ["verify", archive_path])
 
-            # Should succeed
-            assert result.exit_code == 0
-            mock_verifier_instance.verify_auto.assert_called_once()
-        finally:
-            # Cleanup
-            os.unlink(archive_path)
+        # Should succeed
+        assert result.exit_code == 0
+        mock_verifier_instance.verify_auto.assert_called_once()
 
 
 class TestRepairCommand:
     """Test repair command functionality."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create CLI test runner."""
-        return CliRunner()
-
-    def test_repair_help(self, runner):
-        """Test repair command help."""
-        result = runner.invoke(app, ["repair", "--help"])
-        assert result.exit_code == 0
-        assert "Repair" in result.stdout
-
-    def test_repair_nonexistent_archive(self, runner):
-        """Test repair with non-existent archive."""
-        result = runner.invoke(app, ["repair", "/nonexistent/archive.7z"])
-        assert result.exit_code == ExitCodes.FILE_NOT_FOUND
-        # Remove ANSI color codes for assertion
-        clean_output = result.stdout.replace("\x1b[31m", "").replace("\x1b[0m", "")
-        assert "File not found" in clean_output
-
     @patch("coldpack.cli.ArchiveRepairer")
-    def test_repair_success(self, mock_repairer, runner):
+    def test_repair_success(self, mock_repairer, runner, dummy_par2_file):
         """Test successful repair."""
-        # Create temporary PAR2 file
-        with tempfile.NamedTemporaryFile(suffix=".par2", delete=False) as tmp_par2:
-            par2_path = tmp_par2.name
-            tmp_par2.write(b"dummy par2 content")
-
-        try:
-            # Mock repairer
-            mock_repairer_instance = MagicMock()
-            mock_repairer.return_value = mock_repairer_instance
-
-            # Mock repair capability check
-            mock_repairer_instance.check_repair_capability.return_value = {
-                "can_repair": True,
-                "par2_status": "available",
-                "original_file_exists": True,
-            }
-
-            # Mock successful repair result
-            from coldpack.core.repairer import RepairResult
-
-            successful_result = RepairResult(
-                success=True, message="Archive repaired successfully", repaired_files=[]
-            )
-            mock_repairer_instance.repair_archive.return_value = successful_result
+        par2_path = str(dummy_par2_file)
+
+        # Mock repairer
+        mock_repairer_instance = Mock(spec=ArchiveRepairer)
+        mock_repairer.return_value = mock_repairer_instance
+
+        # Mock repair capability check
+        mock_repairer_instance.check_repair_capability.return_value = {
+            "can_repair": True,
+            "par2_status": "available",
+            "original_file_exists": True,
+        }
+
+        # Mock successful repair result
+        successful_result = RepairResult(
+            success=True, message="Archive repaired successfully", repaired_files=[]
+        )
+        mock_repairer_instance.repair_archive.return_value = successful_result
 
-            result = runner.invoke(app, ["repair", par2_path])
+        result = runner.invoke(app, ["repair", par2_path])
 
-            # Should succeed
-            assert result.exit_code == 0
-            mock_repairer_instance.check_repair_capability.assert_called_once()
-            mock_repairer_instance.repair_archive.assert_called_once()
-        finally:
-            # Cleanup
-            os.unlink(par2_path)
+        # Should succeed
+        assert result.exit_code == 0
+        mock_repairer_instance.check_repair_capability.assert_called_once()
+        mock_repairer_instance.repair_archive.assert_called_once()
 
 
 class TestInfoCommand:
     """Test info command functionality."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create CLI test runner."""
-        return CliRunner()
-
-    def test_info_help(self, runner):
-        """Test info command help."""
-        result = runner.invoke(app, ["info", "--help"])
-        assert result.exit_code == 0
-        assert "Show" in result.stdout
-
-    def test_info_nonexistent_archive(self, runner):
-        """Test info with non-existent archive."""
-        result = runner.invoke(app, ["info", "/nonexistent/archive.7z"])
-        assert result.exit_code == ExitCodes.FILE_NOT_FOUND
-        # Remove ANSI color codes for assertion
-        clean_output = result.stdout.replace("\x1b[31m", "").replace("\x1b[0m", "")
-        assert "File not found" in clean_output
-
     @patch("coldpack.cli.MultiFormatExtractor")
-    def test_info_success(self, mock_extractor, runner):
+    def test_info_success(self, mock_extractor, runner, dummy_7z_archive):
         """Test successful info display."""
-        # Create temporary archive file
-        with tempfile.NamedTemporaryFile(suffix=".7z", delete=False) as tmp_archive:
-            archive_path = tmp_archive.name
-            tmp_archive.write(b"dummy archive content")
-
-        try:
-            # Mock extractor
-            mock_extractor_instance = MagicMock()
-            mock_extractor.return_value = mock_extractor_instance
-            mock_extractor_instance.get_archive_info.return_value = {
-                "path": archive_path,
-                "format": ".7z",
-                "file_count": 5,
-                "size": 1024,
-                "has_single_root": True,
-                "root_name": "test_root",
-            }
-
-            result = runner.invoke(app, ["info", archive_path])
-
-            # Should succeed
-            assert result.exit_code == 0
-            mock_extractor_instance.get_archive_info.assert_called_once()
-            assert "Archive:" in result.stdout
-        finally:
-            # Cleanup
-            os.unlink(archive_path)
+        archive_path = str(dummy_7z_archive)
+
+        # Mock extractor
+        mock_extractor_instance = Mock(spec=MultiFormatExtractor)
+        mock_extractor.return_value = mock_extractor_instance
+        mock_extractor_instance.get_archive_info.return_value = {
+            "path": archive_path,
+            "format": ".7z",
+            "file_count": 5,
+            "size": 1024,
+            "has_single_root": True,
+            "root_name": "test_root",
+        }
+
+        result = runner.invoke(app, ["info", archive_path])
+
+        # Should succeed
+        assert result.exit_code == 0
+        mock_extractor_instance.get_archive_info.assert_called_once()
+        assert "Archive:" in result.stdout
 
 
 class TestMetadataLoading:
     """Test coldpack metadata loading functionality."""
 
-    def test_load_metadata_no_file(self):
+    def test_load_metadata_no_file(self, tmp_path):
         """Test loading metadata when file doesn't exist."""
-        from coldpack.cli import _load_coldpack_metadata
+        archive_path = tmp_path / "test.7z"
+        archive_path.write_text("dummy archive")
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            archive_path = Path(temp_dir) / "test.7z"
-            archive_path.write_text("dummy archive")
+        metadata, error = _load_coldpack_metadata(archive_path)
+        assert metadata is None
+        assert error is None
 
-            metadata, error = _load_coldpack_metadata(archive_path)
-            assert metadata is None
-            assert error is None
-
-    def test_load_metadata_corrupted_file(self):
+    def test_load_metadata_corrupted_file(self, tmp_path):
         """Test loading corrupted metadata file."""
-        from coldpack.cli import _load_coldpack_metadata
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            archive_path = Path(temp_dir) / "test.7z"
-            archive_path.write_text("dummy archive")
+        archive_path = tmp_path / "test.7z"
+        archive_path.write_text("dummy archive")
 
-            # Create corrupted metadata file
-            metadata_dir = archive_path.parent / "metadata"
-            metadata_dir.mkdir()
-            metadata_file = metadata_dir / "metadata.toml"
-            metadata_file.write_text("invalid toml content [[[")
+        # Create corrupted metadata file
+        metadata_dir = archive_path.parent / "metadata"
+        metadata_dir.mkdir()
+        metadata_file = metadata_dir / "metadata.toml"
+        metadata_file.write_text("invalid toml content [[[")
 
-            metadata, error = _load_coldpack_metadata(archive_path, verbose=True)
-            assert metadata is None
-            assert error is not None
-            assert "Corrupted metadata.toml" in error
+        metadata, error = _load_coldpack_metadata(archive_path, verbose=True)
+        assert metadata is None
+        assert error is not None
+        assert "Corrupted metadata.toml" in error
 
 
 class TestKeyboardInterruptCleanup:
     """Test KeyboardInterrupt cleanup mechanism."""
 
     @pytest.fixture
-    def runner(self):
-        """Create CLI test runner."""
-        return CliRunner()
-
-    @pytest.fixture
-    def temp_test_files(self):
+    def temp_test_files(self, tmp_path):
         """Create temporary test files and directories."""
-        with tempfile.TemporaryDirectory() as base_temp_dir:
-            base_path = Path(base_temp_dir)
+        # Create a source directory with some test files
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
 
-            # Create a source directory with some test files
-            source_dir = base_path / "source"
-            source_dir.mkdir()
+        # Add some test files to make archiving take some time
+        for i in range(5):
+            test_file = source_dir / f"test_file_{i}.txt"
+            test_file.write_text("x" * (1024 * 100))  # 100KB files
 
-            # Add some test files to make archiving take some time
-            for i in range(5):
-                test_file = source_dir / f"test_file_{i}.txt"
-                test_file.write_text("x" * (1024 * 100))  # 100KB files
+        # Create output directory
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
 
-            # Create output directory
-            output_dir = base_path / "output"
-            output_dir.mkdir()
-
-            yield {
-                "source_dir": source_dir,
-                "output_dir": output_dir,
-                "base_path": base_path,
-            }
+        return {
+            "source_dir": source_dir,
+            "output_dir": output_dir,
+            "base_path": tmp_path,
+        }
 
     def test_create_command_keyboard_interrupt_propagation(
         self, runner, temp_test_files
@@ -932,7 +639,7 @@ class TestKeyboardInterruptCleanup:
 
         # Mock the archiver to simulate KeyboardInterrupt during creation
         with patch("coldpack.cli.ColdStorageArchiver") as mock_archiver_class:
-            mock_archiver = MagicMock()
+            mock_archiver = Mock(spec=ColdStorageArchiver)
             mock_archiver_class.return_value = mock_archiver
 
             # Simulate KeyboardInterrupt during archive creation
@@ -961,9 +668,6 @@ class TestKeyboardInterruptCleanup:
         self, temp_test_files
     ):
         """Test that safe_file_operations cleans up on KeyboardInterrupt."""
-        from coldpack.config.settings import ProcessingOptions
-        from coldpack.core.archiver import ColdStorageArchiver
-
         source_dir = temp_test_files["source_dir"]
         output_dir = temp_test_files["output_dir"]
 
@@ -975,7 +679,7 @@ class TestKeyboardInterruptCleanup:
         with patch(
             "coldpack.core.archiver.SevenZipCompressor"
         ) as mock_compressor_class:
-            mock_compressor = MagicMock()
+            mock_compressor = Mock(spec=SevenZipCompressor)
             mock_compressor_class.return_value = mock_compressor
 
             # Mock the compression to raise KeyboardInterrupt
@@ -998,45 +702,13 @@ class TestKeyboardInterruptCleanup:
                 # Allow for some files that might not be cleaned up due to timing
                 assert len(contents) <= 2, f"Cleanup may have failed, found: {contents}"
 
-    def test_safe_file_operations_context_manager(self):
+    def test_safe_file_operations_context_manager(self, tmp_path):
         """Test safe_file_operations context manager cleanup behavior."""
-        from coldpack.utils.filesystem import safe_file_operations
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Test cleanup on exception
-            test_file = temp_path / "test_cleanup.txt"
-            test_dir = temp_path / "test_dir"
-
-            try:
-                with safe_file_operations(cleanup_on_error=True) as safe_ops:
-                    # Create some files and track them
-                    test_file.write_text("test content")
-                    test_dir.mkdir()
-
-                    safe_ops.track_file(test_file)
-                    safe_ops.track_directory(test_dir)
-
-                    # Simulate KeyboardInterrupt
-                    raise KeyboardInterrupt("Simulated interrupt")
-
-            except KeyboardInterrupt:
-                # After exception, files should be cleaned up
-                assert not test_file.exists(), "File should be cleaned up"
-                assert not test_dir.exists(), "Directory should be cleaned up"
-
-    def test_safe_file_operations_no_cleanup_on_success(self):
-        """Test that safe_file_operations doesn't cleanup on successful completion."""
-        from coldpack.utils.filesystem import safe_file_operations
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Test no cleanup on success
-            test_file = temp_path / "test_success.txt"
-            test_dir = temp_path / "test_success_dir"
+        # Test cleanup on exception
+        test_file = tmp_path / "test_cleanup.txt"
+        test_dir = tmp_path / "test_dir"
 
+        try:
             with safe_file_operations(cleanup_on_error=True) as safe_ops:
                 # Create some files and track them
                 test_file.write_text("test content")
@@ -1045,19 +717,39 @@ class TestKeyboardInterruptCleanup:
                 safe_ops.track_file(test_file)
                 safe_ops.track_directory(test_dir)
 
-                # Normal completion - no exception
+                # Simulate KeyboardInterrupt
+                raise KeyboardInterrupt("Simulated interrupt")
+
+        except KeyboardInterrupt:
+            # After exception, files should be cleaned up
+            assert not test_file.exists(), "File should be cleaned up"
+            assert not test_dir.exists(), "Directory should be cleaned up"
+
+    def test_safe_file_operations_no_cleanup_on_success(self, tmp_path):
+        """Test that safe_file_operations doesn't cleanup on successful completion."""
+        # Test no cleanup on success
+        test_file = tmp_path / "test_success.txt"
+        test_dir = tmp_path / "test_success_dir"
+
+        with safe_file_operations(cleanup_on_error=True) as safe_ops:
+            # Create some files and track them
+            test_file.write_text("test content")
+            test_dir.mkdir()
+
+            safe_ops.track_file(test_file)
+            safe_ops.track_directory(test_dir)
 
-            # Files should still exist after successful completion
-            assert test_file.exists(), "File should remain after success"
-            assert test_dir.exists(), "Directory should remain after success"
+            # Normal completion - no exception
+
+        # Files should still exist after successful completion
+        assert test_file.exists(), "File should remain after success"
+        assert test_dir.exists(), "Directory should remain after success"
 
     def test_extractor_keyboard_interrupt_cleanup(self, temp_test_files):
         """Test that extractor KeyboardInterrupt is properly propagated."""
         # This test ensures extractor doesn't swallow KeyboardInterrupt
         # The actual cleanup is handled by safe_file_operations in extractor
 
-        from coldpack.core.extractor import MultiFormatExtractor
-
         extractor = MultiFormatExtractor()
         test_archive = temp_test_files["base_path"] / "nonexistent.7z"
         output_dir = temp_test_files["output_dir"] / "extract_test"
@@ -1075,15 +767,6 @@ class TestDisplayArchiveSummary:
 
     def test_display_archive_summary_with_full_metadata(self):
         """Test display_archive_summary with comprehensive metadata."""
-        from unittest.mock import MagicMock, patch
-
-        from coldpack.cli import display_archive_summary
-        from coldpack.config.settings import (
-            ArchiveMetadata,
-            PAR2Settings,
-            SevenZipSettings,
-        )
-
         # Create comprehensive metadata
         sevenzip_settings = SevenZipSettings(
             level=5, dictionary_size="16m", threads=True
@@ -1111,8 +794,7 @@ class TestDisplayArchiveSummary:
         )
 
         # Create result object with metadata
-        result = MagicMock()
-        result.metadata = metadata
+        result = ArchiveResult(success=True, metadata=metadata)
 
         # Mock console to capture output
         with patch("coldpack.cli.console") as mock_console:
@@ -1133,11 +815,6 @@ class TestDisplayArchiveSummary:
 
     def test_display_archive_summary_with_minimal_metadata(self):
         """Test display_archive_summary with minimal metadata."""
-        from unittest.mock import MagicMock, patch
-
-        from coldpack.cli import display_archive_summary
-        from coldpack.config.settings import ArchiveMetadata
-
         # Create minimal metadata
         metadata = ArchiveMetadata(
             source_path=Path("/test/source"),
@@ -1149,8 +826,7 @@ class TestDisplayArchiveSummary:
             compression_ratio=0.8,
         )
 
-        result = MagicMock()
-        result.metadata = metadata
+        result = ArchiveResult(success=True, metadata=metadata)
 
         # Mock console to capture output
         with patch("coldpack.cli.console") as mock_console:
@@ -1161,11 +837,6 @@ class TestDisplayArchiveSummary:
 
     def test_display_archive_summary_with_negative_compression_ratio(self):
         """Test display_archive_summary with negative compression ratio (file grew)."""
-        from unittest.mock import MagicMock, patch
-
-        from coldpack.cli import display_archive_summary
-        from coldpack.config.settings import ArchiveMetadata
-
         # Create metadata with negative compression (file grew)
         metadata = ArchiveMetadata(
             source_path=Path("/test/source"),
@@ -1177,8 +848,7 @@ class TestDisplayArchiveSummary:
             compression_ratio=2.0,  # File doubled in size
         )
 
-        result = MagicMock()
-        result.metadata = metadata
+        result = ArchiveResult(success=True, metadata=metadata)
 
         # Mock console to capture output
         with patch("coldpack.cli.console") as mock_console:
@@ -1189,13 +859,8 @@ class TestDisplayArchiveSummary:
 
     def test_display_archive_summary_no_metadata(self):
         """Test display_archive_summary with no metadata returns early."""
-        from unittest.mock import MagicMock, patch
-
-        from coldpack.cli import display_archive_summary
-
         # Create result with no metadata
-        result = MagicMock()
-        result.metadata = None
+        result = ArchiveResult(success=True, metadata=None)
 
         # Mock console to capture output
         with patch("coldpack.cli.console") as mock_console:
@@ -1206,11 +871,6 @@ class TestDisplayArchiveSummary:
 
     def test_display_archive_summary_hash_formatting(self):
         """Test hash display formatting in archive summary."""
-        from unittest.mock import MagicMock, patch
-
-        from coldpack.cli import display_archive_summary
-        from coldpack.config.settings import ArchiveMetadata
-
         # Create metadata with various hash lengths
         metadata = ArchiveMetadata(
             source_path=Path("/test/source"),
@@ -1226,8 +886,7 @@ class TestDisplayArchiveSummary:
             },
         )
 
-        result = MagicMock()
-        result.metadata = metadata
+        result = ArchiveResult(success=True, metadata=metadata)
 
         with patch("coldpack.cli.console") as mock_console:
             display_archive_summary(result)
@@ -1236,5 +895,36 @@ class TestDisplayArchiveSummary:
             assert mock_console.print.call_count >= 3
 
 
+class TestDisplayPar2Info:
+    """Test PAR2 recovery information display."""
+
+    @pytest.mark.parametrize(
+        ("is_turbo", "expected", "unexpected"),
+        [
+            (True, "par2cmdline-turbo", "is faster"),
+            (False, "par2cmdline-turbo is faster", None),
+        ],
+    )
+    def test_display_par2_info_shows_tool(self, capsys, is_turbo, expected, unexpected):
+        """Test that the PAR2 table names the par2 build in use."""
+        par2_manager = Mock(spec=PAR2Manager)
+        par2_manager.is_turbo = is_turbo
+        par2_manager.get_recovery_info.return_value = {
+            "redundancy_percent": 10,
+            "file_count": 0,
+            "total_size": 0,
+            "par2_files": [],
+        }
+
+        with patch("coldpack.cli.PAR2Manager", return_value=par2_manager):
+            display_par2_info(Path("test.7z.par2"))
+
+        output = capsys.readouterr().out
+        assert "PAR2 Tool" in output
+        assert expected in output
+        if unexpected:
+            assert unexpected not in output
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -23,28 +23,6 @@ from coldpack.core.archiver import ColdStorageArchiver
 class TestMemoryLimitEndToEndFlow:
     """Test complete memory_limit flow from CLI to compression."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create CLI test runner."""
-        return CliRunner()
-
-    @pytest.fixture
-    def temp_source_dir(self):
-        """Create temporary source directory with test content."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create test files
-            (temp_path / "file1.txt").write_text("test content 1")
-            (temp_path / "file2.txt").write_text("test content 2")
-
-            # Create subdirectory
-            subdir = temp_path / "subdir"
-            subdir.mkdir()
-            (subdir / "nested.txt").write_text("nested content")
-
-            yield temp_path
-
     def test_cli_memory_limit_to_py7zz_config_flow(self, runner, temp_source_dir):
         """Test complete flow: CLI --memory-limit → SevenZipSettings → py7zz config."""
         from coldpack.core.archiver import ArchiveResult
@@ -3,6 +3,8 @@
 
 """Tests for 7z compression utilities using py7zz."""
 
+import struct
+import zlib
 from unittest.mock import Mock, patch
 
 import pytest
@@ -11,6 +13,8 @@ from coldpack.config.settings import SevenZipSettings
 from coldpack.utils.sevenzip import (
     CompressionError,
     SevenZipCompressor,
+    check_7z_headers,
+    compress_many,
     get_7z_info,
     optimize_7z_compression_settings,
     validate_7z_archive,
@@ -104,6 +108,11 @@ class TestSevenZipSettings:
         with pytest.raises(ValueError):
             SevenZipSettings(method="INVALID")
 
+        # Codecs from the 7-Zip-zstd fork are not available in upstream 7-Zip
+        for method in ["FLZMA2", "ZSTD"]:
+            with pytest.raises(ValueError):
+                SevenZipSettings(method=method)
+
     def test_memory_limit_validation(self):
         """Test memory_limit parameter validation."""
         # Valid memory limits
@@ -265,6 +274,25 @@ class TestSevenZipCompressor:
         assert call_args[0][1] == "w"  # write mode
         assert hasattr(call_args[1]["config"], "level")  # config object passed
 
+    @patch("coldpack.utils.sevenzip.py7zz")
+    def test_compress_reuses_py7zz_config(self, mock_py7zz, tmp_path):
+        """Test the py7zz config is built once per compressor."""
+        test_dir = tmp_path / "test_source"
+        test_dir.mkdir()
+
+        with patch.object(
+            SevenZipSettings,
+            "to_py7zz_config",
+            return_value={"level": 5},
+        ) as mock_to_config:
+            compressor = SevenZipCompressor()
+            compressor.compress_directory(test_dir, tmp_path / "a.7z")
+            compressor.compress_directory(test_dir, tmp_path / "b.7z")
+
+        mock_to_config.assert_called_once()
+        assert mock_py7zz.Config.call_count == 2
+        mock_py7zz.Config.assert_called_with(level=5, auto_compression=False)
+
     def test_compress_directory_nonexistent_source(self, tmp_path):
         """Test compression with non-existent source."""
         compressor = SevenZipCompressor()
@@ -303,6 +331,35 @@ class TestSevenZipCompressor:
         with pytest.raises(CompressionError, match="7z compression failed"):
             compressor.compress_directory(test_dir, archive_path)
 
+    @patch("coldpack.utils.sevenzip.py7zz")
+    def test_compress_files_success(self, mock_py7zz, tmp_path):
+        """Test compressing an explicit list of files."""
+        file1 = tmp_path / "file1.txt"
+        file2 = tmp_path / "file2.txt"
+        file1.write_text("test content 1")
+        file2.write_text("test content 2")
+
+        compressor = SevenZipCompressor()
+        compressor.compress_files([file1, str(file2)], tmp_path / "test.7z")
+
+        mock_archive = mock_py7zz.SevenZipFile.return_value.__enter__.return_value
+        added = [call.args[0] for call in mock_archive.add.call_args_list]
+        assert added == [str(file1), str(file2)]
+
+    @patch("coldpack.utils.sevenzip.py7zz")
+    def test_compress_files_missing_file(self, mock_py7zz, tmp_path):
+        """Test that a missing file is reported before compression starts."""
+        existing = tmp_path / "file1.txt"
+        existing.write_text("test content")
+
+        compressor = SevenZipCompressor()
+        with pytest.raises(FileNotFoundError, match="Source file not found"):
+            compressor.compress_files(
+                [existing, tmp_path / "missing.txt"], tmp_path / "test.7z"
+            )
+
+        mock_py7zz.SevenZipFile.assert_not_called()
+
     @patch("coldpack.utils.sevenzip.py7zz")
     def test_test_integrity_success(self, mock_py7zz, tmp_path):
         """Test successful archive integrity test."""
@@ -378,6 +435,32 @@ class TestSevenZipCompressor:
         assert len(progress_calls) == 1
         assert progress_calls[0] == (0, "Processing...")
 
+    def test_progress_adapter_throttles_updates(self):
+        """Test that repeated or too frequent updates are not forwarded."""
+        compressor = SevenZipCompressor()
+
+        progress_calls = []
+
+        def test_callback(percentage, current_file):
+            progress_calls.append((percentage, current_file))
+
+        adapter = compressor._create_progress_adapter(test_callback)
+
+        def progress(percentage):
+            return Mock(percentage=percentage, current_file="file.txt")
+
+        with patch("coldpack.utils.sevenzip.time.monotonic") as mock_monotonic:
+            mock_monotonic.return_value = 10.0
+            adapter(progress(10))
+            adapter(progress(10.4))  # Same integer percentage
+            adapter(progress(20))  # Too soon after the last update
+            adapter(progress(100))  # Completion is always forwarded
+
+            mock_monotonic.return_value = 11.0
+            adapter(progress(100))  # Unchanged percentage
+
+        assert progress_calls == [(10, "file.txt"), (100, "file.txt")]
+
 
 class TestOptimization:
     """Test 7z compression optimization functions."""
@@ -409,6 +492,18 @@ class TestOptimization:
         assert settings.solid is True
         assert settings.method == "LZMA2"
 
+    def test_optimize_small_medium_dictionary_split(self):
+        """Test that inputs under 4 MiB get a dictionary sized to the input."""
+        # 2 MiB
+        settings = optimize_7z_compression_settings(2 * 1024 * 1024)
+        assert settings.level == 5
+        assert settings.dictionary_size == "1m"
+
+        # Exactly 4 MiB - full small-medium dictionary
+        settings = optimize_7z_compression_settings(4 * 1024 * 1024)
+        assert settings.level == 5
+        assert settings.dictionary_size == "4m"
+
     def test_optimize_medium_size(self):
         """Test optimization for medium files (8 – 64 MiB)."""
         # 32 MiB
@@ -476,19 +571,31 @@ class TestOptimization:
         # Test with specific thread count
         settings = optimize_7z_compression_settings(1024 * 1024, threads=4)
         assert settings.level == 5  # Small-medium range
-        assert settings.dictionary_size == "4m"
+        assert settings.dictionary_size == "1m"
         assert settings.threads == 4
 
-        # Test with auto-detect threads (default)
-        settings = optimize_7z_compression_settings(1024 * 1024)
-        assert settings.threads is True  # All cores
+        # Test with auto-detect threads (default): resolved to an explicit count
+        with patch("coldpack.utils.sevenzip._CPU_COUNT", 32):
+            settings = optimize_7z_compression_settings(1024 * 1024)
+            assert settings.threads == 16  # All cores, capped for LZMA2
+
+            settings = optimize_7z_compression_settings(100 * 1024)
+            assert settings.threads == 2  # Small inputs use few threads
+
+        with patch("coldpack.utils.sevenzip._CPU_COUNT", 1):
+            settings = optimize_7z_compression_settings(1024 * 1024)
+            assert settings.threads == 1
+
+        # Single-thread setting is kept as is
+        settings = optimize_7z_compression_settings(1024 * 1024, threads=False)
+        assert settings.threads is False
 
     def test_optimize_with_memory_limit(self):
         """Test optimization with memory_limit parameter."""
         # Test with memory limit
         settings = optimize_7z_compression_settings(1024 * 1024, memory_limit="512m")
         assert settings.level == 5  # Small-medium range
-        assert settings.dictionary_size == "4m"
+        assert settings.dictionary_size == "1m"
         assert settings.memory_limit == "512m"
 
         # Test without memory limit
@@ -500,7 +607,7 @@ class TestOptimization:
             1024 * 1024, threads=2, memory_limit="1g"
         )
         assert settings.level == 5
-        assert settings.dictionary_size == "4m"
+        assert settings.dictionary_size == "1m"
         assert settings.threads == 2
         assert settings.memory_limit == "1g"
 
@@ -564,6 +671,25 @@ class TestUtilityFunctions:
         assert info["has_single_root"] is False
         assert info["root_name"] is None
 
+    @patch("coldpack.utils.sevenzip.py7zz")
+    def test_get_7z_info_windows_separators(self, mock_py7zz, tmp_path):
+        """Test single-root detection with backslash separators."""
+        archive_path = tmp_path / "test.7z"
+        archive_path.write_text("mock archive")
+        mock_py7zz.get_archive_info.return_value = {"file_count": 2}
+
+        mock_archive = mock_py7zz.SevenZipFile.return_value.__enter__.return_value
+        mock_archive.namelist.return_value = [
+            "root_dir\\file1.txt",
+            "/",
+            "root_dir/sub\\file2.txt",
+        ]
+
+        info = get_7z_info(archive_path)
+
+        assert info["has_single_root"] is True
+        assert info["root_name"] == "root_dir"
+
     def test_get_7z_info_nonexistent_archive(self, tmp_path):
         """Test 7z info with non-existent archive."""
         nonexistent_archive = tmp_path / "nonexistent.7z"
@@ -572,33 +698,148 @@ class TestUtilityFunctions:
             get_7z_info(nonexistent_archive)
 
     @patch("coldpack.utils.sevenzip.SevenZipCompressor")
-    def test_validate_7z_archive_success(self, mock_compressor):
+    @patch("coldpack.utils.sevenzip.py7zz")
+    def test_validate_7z_archive_success(self, mock_py7zz, mock_compressor, tmp_path):
         """Test successful 7z archive validation."""
-        mock_compressor_instance = Mock()
-        mock_compressor_instance.test_integrity.return_value = True
-        mock_compressor.return_value = mock_compressor_instance
+        archive_path = tmp_path / "test.7z"
+        archive_path.write_text("mock archive content")
+        mock_py7zz.test_archive.return_value = True
 
-        result = validate_7z_archive("test.7z")
+        result = validate_7z_archive(archive_path)
         assert result is True
+        mock_py7zz.test_archive.assert_called_once_with(str(archive_path))
+        mock_compressor.assert_not_called()
 
-    @patch("coldpack.utils.sevenzip.SevenZipCompressor")
-    def test_validate_7z_archive_failure(self, mock_compressor):
+    @patch("coldpack.utils.sevenzip.py7zz")
+    def test_validate_7z_archive_failure(self, mock_py7zz, tmp_path):
         """Test failed 7z archive validation."""
-        mock_compressor_instance = Mock()
-        mock_compressor_instance.test_integrity.return_value = False
-        mock_compressor.return_value = mock_compressor_instance
+        archive_path = tmp_path / "test.7z"
+        archive_path.write_text("mock archive content")
+        mock_py7zz.test_archive.return_value = False
 
-        result = validate_7z_archive("test.7z")
+        result = validate_7z_archive(archive_path)
         assert result is False
 
-    @patch("coldpack.utils.sevenzip.SevenZipCompressor")
-    def test_validate_7z_archive_exception(self, mock_compressor):
+    @patch("coldpack.utils.sevenzip.py7zz")
+    def test_validate_7z_archive_exception(self, mock_py7zz, tmp_path):
         """Test 7z archive validation with exception."""
-        mock_compressor.side_effect = Exception("Test error")
+        archive_path = tmp_path / "test.7z"
+        archive_path.write_text("mock archive content")
+        mock_py7zz.test_archive.side_effect = Exception("Test error")
 
-        result = validate_7z_archive("test.7z")
+        result = validate_7z_archive(archive_path)
         assert result is False
 
+    def test_validate_7z_archive_nonexistent(self, tmp_path):
+        """Test 7z archive validation with non-existent archive."""
+        assert validate_7z_archive(tmp_path / "nonexistent.7z") is False
+
+    @patch("coldpack.utils.sevenzip._CPU_COUNT", 8)
+    @patch("coldpack.utils.sevenzip.py7zz")
+    def test_compress_many(self, mock_py7zz, tmp_path):
+        """Test batch compression splits cores and reports each archive."""
+        source_a = tmp_path / "a"
+        source_a.mkdir()
+        source_b = tmp_path / "b"
+        source_b.mkdir()
+        archive_a = tmp_path / "out" / "a.7z"
+        archive_b = tmp_path / "out" / "b.7z"
+        archive_missing = tmp_path / "out" / "missing.7z"
+
+        results = compress_many(
+            [
+                (source_a, archive_a),
+                (source_b, archive_b),
+                (tmp_path / "missing", archive_missing),
+            ]
+        )
+
+        assert results == {
+            archive_a: True,
+            archive_b: True,
+            archive_missing: False,
+        }
+        # 8 cores shared by 3 concurrent archives
+        for call in mock_py7zz.Config.call_args_list:
+            assert call.kwargs["threads"] == 2
+
+    def test_compress_many_records_os_error_per_job(self, tmp_path):
+        """Test that an OSError in one job does not abort the whole batch."""
+        archive_ok = tmp_path / "ok.7z"
+        archive_denied = tmp_path / "denied.7z"
+
+        def fake_compress(self, source_dir, archive_path, progress_callback=None):
+            if archive_path == archive_denied:
+                raise PermissionError("Permission denied")
+
+        with patch.object(
+            SevenZipCompressor,
+            "compress_directory",
+            autospec=True,
+            side_effect=fake_compress,
+        ):
+            results = compress_many(
+                [(tmp_path / "a", archive_ok), (tmp_path / "b", archive_denied)]
+            )
+
+        assert results == {archive_ok: True, archive_denied: False}
+
+    def test_compress_many_empty(self):
+        """Test batch compression with no jobs."""
+        assert compress_many([]) == {}
+
+
+class TestHeaderCheck:
+    """Test constant-time 7z header validation."""
+
+    @staticmethod
+    def _write_archive(path, payload=b"\x00" * 5, next_header=b"\x01\x04\x06\x00"):
+        """Write a file with valid 7z signature and start/next headers."""
+        start_header = struct.pack(
+            "<QQI", len(payload), len(next_header), zlib.crc32(next_header)
+        )
+        path.write_bytes(
+            b"7z\xbc\xaf\x27\x1c\x00\x04"
+            + struct.pack("<I", zlib.crc32(start_header))
+            + start_header
+            + payload
+            + next_header
+        )
+        return path
+
+    def test_check_7z_headers_valid(self, tmp_path):
+        """Test that well-formed headers pass."""
+        archive_path = self._write_archive(tmp_path / "test.7z")
+
+        assert check_7z_headers(archive_path) is True
+
+    def test_check_7z_headers_bad_signature(self, tmp_path):
+        """Test that a non-7z file fails."""
+        archive_path = tmp_path / "test.7z"
+        archive_path.write_bytes(b"dummy archive content that is not 7z")
+
+        assert check_7z_headers(archive_path) is False
+
+    def test_check_7z_headers_truncated(self, tmp_path):
+        """Test that a truncated archive fails."""
+        archive_path = self._write_archive(tmp_path / "test.7z")
+        archive_path.write_bytes(archive_path.read_bytes()[:-1])
+
+        assert check_7z_headers(archive_path) is False
+
+    def test_check_7z_headers_corrupted_next_header(self, tmp_path):
+        """Test that a corrupted next header fails."""
+        archive_path = self._write_archive(tmp_path / "test.7z")
+        data = bytearray(archive_path.read_bytes())
+        data[-1] ^= 0xFF
+        archive_path.write_bytes(bytes(data))
+
+        assert check_7z_headers(archive_path) is False
+
+    def test_check_7z_headers_nonexistent(self, tmp_path):
+        """Test that a missing archive fails."""
+        assert check_7z_headers(tmp_path / "missing.7z") is False
+
 
 class TestCrossPlatformCompatibility:
     """Test cross-platform compatibility features."""
@@ -668,6 +909,24 @@ class TestErrorHandling:
         with pytest.raises(CompressionError, match="Unexpected error"):
             compressor.compress_directory(test_dir, archive_path)
 
+    @patch("coldpack.utils.sevenzip.py7zz")
+    def test_compress_files_error_translation(self, mock_py7zz, tmp_path):
+        """Test compress_files translates py7zz errors like compress_directory."""
+        test_file = tmp_path / "file1.txt"
+        test_file.write_text("test content")
+        archive_path = tmp_path / "test.7z"
+
+        mock_py7zz.FileNotFoundError = type("FileNotFoundError", (Exception,), {})
+        mock_py7zz.InsufficientSpaceError = type(
+            "InsufficientSpaceError", (Exception,), {}
+        )
+        mock_context = mock_py7zz.SevenZipFile.return_value.__enter__.return_value
+        mock_context.add.side_effect = mock_py7zz.FileNotFoundError("File not found")
+
+        compressor = SevenZipCompressor()
+        with pytest.raises(FileNotFoundError, match="during compression"):
+            compressor.compress_files([test_file], archive_path)
+
     def test_progress_callback_exception_handling(self):
         """Test that progress callback exceptions don't break compression."""
         compressor = SevenZipCompressor()
@@ -3,17 +3,34 @@
 
 """Tests for utility modules."""
 
+import os
+import subprocess
+import sys
+from contextlib import suppress
+from unittest.mock import patch
+
 import pytest
 
+from coldpack.utils import filesystem, temp_manager
 from coldpack.utils.filesystem import (
     check_disk_space,
     cleanup_temp_directory,
     create_temp_directory,
     format_file_size,
     get_file_size,
+    safe_file_operations,
     safe_temp_directory,
+    validate_paths,
 )
 from coldpack.utils.hashing import compute_blake3_hash, compute_sha256_hash
+from coldpack.utils.par2 import (
+    PAR2_STDERR_TAIL_LINES,
+    PAR2Error,
+    PAR2Manager,
+    _resolve_par2_command,
+    _run_par2,
+)
+from coldpack.utils.temp_manager import _fast_rmtree
 
 
 class TestFilesystemUtils:
@@ -25,6 +42,9 @@ class TestFilesystemUtils:
         assert format_file_size(1024) == "1.00 KB"
         assert format_file_size(1024 * 1024) == "1.00 MB"
         assert format_file_size(1024 * 1024 * 1024) == "1.00 GB"
+        assert format_file_size(1023) == "1023 bytes"
+        assert format_file_size(1536) == "1.50 KB"
+        assert format_file_size(5 * 1024**4) == "5120.00 GB"
 
     def test_create_and_cleanup_temp_directory(self):
         """Test temporary directory creation and cleanup."""
@@ -75,6 +95,16 @@ class TestFilesystemUtils:
         with pytest.raises(FileNotFoundError):
             get_file_size(tmp_path / "nonexistent.txt")
 
+    def test_validate_paths(self, tmp_path):
+        """Test path validation for existing and output paths."""
+        existing_file = tmp_path / "input.txt"
+        existing_file.write_text("content")
+
+        assert validate_paths(existing_file, tmp_path, tmp_path / "output.7z")
+
+        with pytest.raises(FileNotFoundError, match="Parent directory does not exist"):
+            validate_paths(tmp_path / "missing" / "output.7z")
+
     def test_check_disk_space(self, tmp_path):
         """Test disk space checking."""
         # This should pass for most systems (requiring only 1GB)
@@ -85,6 +115,96 @@ class TestFilesystemUtils:
             # If it fails, we might be in a very constrained environment
             pass
 
+    def test_check_disk_space_uses_cache(self, tmp_path):
+        """Test that repeated disk space checks reuse the cached result."""
+        filesystem._disk_usage_cache.clear()
+        usage = filesystem.shutil.disk_usage(tmp_path)
+
+        with patch.object(
+            filesystem.shutil, "disk_usage", return_value=usage
+        ) as mock_disk_usage:
+            check_disk_space(tmp_path, required_gb=0)
+            check_disk_space(tmp_path, required_gb=0)
+
+        mock_disk_usage.assert_called_once()
+        filesystem._disk_usage_cache.clear()
+
+    def test_fast_rmtree(self, tmp_path):
+        """Test that fast tree removal deletes nested content but not link targets."""
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "keep.txt").write_text("keep")
+
+        root = tmp_path / "root"
+        (root / "a" / "b").mkdir(parents=True)
+        (root / "top.txt").write_text("top")
+        (root / "a" / "b" / "deep.txt").write_text("deep")
+        if hasattr(os, "symlink"):
+            with suppress(OSError):
+                os.symlink(outside, root / "a" / "link", target_is_directory=True)
+
+        _fast_rmtree(root)
+
+        assert not root.exists()
+        assert (outside / "keep.txt").exists()
+
+    def test_fast_rmtree_defers_to_shutil_on_windows(self, tmp_path):
+        """Test that Windows uses shutil.rmtree, which does not follow junctions."""
+        with (
+            patch.object(temp_manager.platform, "system", return_value="Windows"),
+            patch.object(temp_manager.shutil, "rmtree") as mock_rmtree,
+        ):
+            _fast_rmtree(tmp_path)
+
+        mock_rmtree.assert_called_once_with(tmp_path)
+        assert tmp_path.exists()
+
+    def test_safe_file_operations_tracks_plain_strings(self, tmp_path):
+        """Test that tracked paths are stored as strings, not Path objects."""
+        safe_ops = safe_file_operations()
+        safe_ops.track_file(tmp_path / "file.txt")
+        safe_ops.track_file("relative.txt")
+        safe_ops.track_directory(tmp_path / "dir")
+
+        assert safe_ops.created_files == [str(tmp_path / "file.txt"), "relative.txt"]
+        assert safe_ops.created_dirs == [str(tmp_path / "dir")]
+
+    def test_safe_file_operations_skips_missing_paths(self, tmp_path):
+        """Test that cleanup ignores tracked paths that were never created."""
+        created_file = tmp_path / "created.txt"
+        created_dir = tmp_path / "created_dir"
+
+        with pytest.raises(RuntimeError), safe_file_operations() as safe_ops:
+            created_file.write_text("content")
+            created_dir.mkdir()
+            safe_ops.track_file(tmp_path / "missing.txt")
+            safe_ops.track_file(created_file)
+            safe_ops.track_directory(tmp_path / "missing_dir")
+            safe_ops.track_directory(created_dir)
+            raise RuntimeError("boom")
+
+        assert not created_file.exists()
+        assert not created_dir.exists()
+
+    def test_safe_file_operations_removes_only_root_directories(self, tmp_path):
+        """Test that directories nested in another tracked one are not removed twice."""
+        root = tmp_path / "archive"
+        sibling = tmp_path / "archive-other"
+        (root / "metadata" / "deep").mkdir(parents=True)
+        sibling.mkdir()
+
+        safe_ops = safe_file_operations()
+        safe_ops.track_directory(root / "metadata" / "deep")
+        safe_ops.track_directory(root)
+        safe_ops.track_directory(sibling)
+        safe_ops.track_directory(root / "metadata")
+
+        with patch.object(filesystem.shutil, "rmtree") as mock_rmtree:
+            safe_ops._cleanup_created_files()
+
+        removed = [call.args[0] for call in mock_rmtree.call_args_list]
+        assert removed == [str(root), str(sibling)]
+
 
 class TestHashingUtils:
     """Test hashing utility functions."""
@@ -159,6 +279,197 @@ class TestHashingUtils:
         assert blake3_1 != blake3_2
 
 
+class TestPAR2Utils:
+    """Test PAR2 utility functions."""
+
+    @pytest.fixture
+    def par2_manager(self):
+        """Create a PAR2 manager without looking up a real par2 binary."""
+        with patch.object(PAR2Manager, "_find_par2_command", return_value="par2"):
+            return PAR2Manager()
+
+    def test_run_par2_keeps_stderr_tail(self, tmp_path):
+        """Test that only the last stderr lines are kept."""
+        script = (
+            "import sys\n"
+            "for i in range(1000):\n"
+            "    sys.stderr.write(f'line {i}\\n')\n"
+            "sys.exit(3)\n"
+        )
+        returncode, stderr = _run_par2(
+            [sys.executable, "-c", script], tmp_path, timeout=30
+        )
+
+        assert returncode == 3
+        lines = stderr.splitlines()
+        assert len(lines) == PAR2_STDERR_TAIL_LINES
+        assert lines[-1] == "line 999"
+
+    def test_run_par2_tolerates_non_utf8_stderr(self, tmp_path):
+        """Test that undecodable stderr bytes do not stop the drain."""
+        script = "import sys\nsys.stderr.buffer.write(b'bad \\x81 byte\\n')\n"
+        returncode, stderr = _run_par2(
+            [sys.executable, "-c", script], tmp_path, timeout=30
+        )
+
+        assert returncode == 0
+        assert stderr == "bad \ufffd byte\n"
+
+    def test_resolve_par2_command_is_cached(self):
+        """Test that par2 discovery runs once and never executes par2."""
+        _resolve_par2_command.cache_clear()
+        try:
+            with (
+                patch(
+                    "coldpack.utils.par2.shutil.which", return_value="/bin/par2"
+                ) as mock_which,
+                patch("coldpack.utils.par2.subprocess.run") as mock_run,
+            ):
+                assert _resolve_par2_command() == "par2"
+                assert _resolve_par2_command() == "par2"
+
+            mock_which.assert_called_once_with("par2")
+            mock_run.assert_not_called()
+        finally:
+            _resolve_par2_command.cache_clear()
+
+    @pytest.mark.parametrize(
+        ("version_output", "expected"),
+        [("par2cmdline-turbo version 1.3.0", True), ("par2cmdline version 1.0", False)],
+    )
+    def test_is_turbo_probes_once(self, par2_manager, version_output, expected):
+        """Test that the turbo probe runs par2 -V once and caches the answer."""
+        completed = subprocess.CompletedProcess(["par2", "-V"], 0, version_output, "")
+
+        with patch(
+            "coldpack.utils.par2.subprocess.run", return_value=completed
+        ) as mock_run:
+            assert par2_manager.is_turbo is expected
+            assert par2_manager.is_turbo is expected
+
+        mock_run.assert_called_once()
+        assert mock_run.call_args.args[0] == ["par2", "-V"]
+
+    def test_is_turbo_false_when_probe_fails(self, par2_manager):
+        """Test that a failing par2 -V probe reports a baseline build."""
+        with patch("coldpack.utils.par2.subprocess.run", side_effect=OSError):
+            assert par2_manager.is_turbo is False
+
+    def test_find_par2_files_prefix_match(self, par2_manager, tmp_path):
+        """Test that PAR2 discovery matches only files for the given archive."""
+        for name in [
+            "a[1].7z",
+            "a[1].7z.par2",
+            "a[1].7z.vol0+1.par2",
+            "a[1].7z.par2.bak",
+            "b.7z.par2",
+        ]:
+            (tmp_path / name).touch()
+
+        assert par2_manager._find_par2_files(tmp_path / "a[1].7z") == [
+            tmp_path / "a[1].7z.par2",
+            tmp_path / "a[1].7z.vol0+1.par2",
+        ]
+
+    def test_get_recovery_info_sizes(self, par2_manager, tmp_path):
+        """Test that recovery info reports PAR2 file count and total size."""
+        (tmp_path / "test.7z.par2").write_bytes(b"x" * 10)
+        (tmp_path / "test.7z.vol0+1.par2").write_bytes(b"x" * 32)
+        (tmp_path / "other.7z.par2").write_bytes(b"x" * 100)
+
+        info = par2_manager.get_recovery_info(tmp_path / "test.7z.par2")
+
+        assert info["file_count"] == 2
+        assert info["total_size"] == 42
+
+    def test_create_recovery_files_batch_groups_by_directory(
+        self, par2_manager, tmp_path
+    ):
+        """Test that batch creation runs par2 once per parent directory."""
+        first_dir = tmp_path / "first"
+        second_dir = tmp_path / "second"
+        first_dir.mkdir()
+        second_dir.mkdir()
+        files = [first_dir / "a.7z", first_dir / "b.7z", second_dir / "c.7z"]
+        for file_path in files:
+            file_path.write_bytes(b"data")
+
+        def fake_run(cmd, work_dir, timeout):
+            # cmd: par2 create -r<pct> -n<count> -q <par2_base> <targets...>
+            (work_dir / f"{cmd[5]}.par2").touch()
+            return 0, ""
+
+        with patch("coldpack.utils.par2._run_par2", side_effect=fake_run) as mock_run:
+            created = par2_manager.create_recovery_files_batch(files)
+
+        assert mock_run.call_count == 2
+        first_cmd = mock_run.call_args_list[0].args[0]
+        assert first_cmd[-3:] == ["a.7z", "a.7z", "b.7z"]
+        assert created == [first_dir / "a.7z.par2", second_dir / "c.7z.par2"]
+
+    def test_create_recovery_files_batch_rejects_output_dir_outside_group(
+        self, par2_manager, tmp_path
+    ):
+        """Test that output_dir must be inside every group's directory."""
+        first_dir = tmp_path / "first"
+        (first_dir / "metadata").mkdir(parents=True)
+        (tmp_path / "second").mkdir()
+        files = [first_dir / "a.7z", tmp_path / "second" / "b.7z"]
+        for file_path in files:
+            file_path.write_bytes(b"data")
+
+        with (
+            patch("coldpack.utils.par2._run_par2") as mock_run,
+            pytest.raises(PAR2Error, match="not inside"),
+        ):
+            par2_manager.create_recovery_files_batch(
+                files, output_dir=first_dir / "metadata"
+            )
+
+        mock_run.assert_not_called()
+
+    def test_create_recovery_files_batch_with_output_dir(self, par2_manager, tmp_path):
+        """Test that batch creation places the set in output_dir via -B."""
+        metadata_dir = tmp_path / "metadata"
+        files = [tmp_path / "a.7z", tmp_path / "b.7z"]
+        for file_path in files:
+            file_path.write_bytes(b"data")
+
+        def fake_run(cmd, work_dir, timeout):
+            # cmd: par2 create -B<base> -r<pct> -n<count> -q <rel_par2> <targets...>
+            (work_dir / f"{cmd[6]}.par2").touch()
+            return 0, ""
+
+        with patch("coldpack.utils.par2._run_par2", side_effect=fake_run) as mock_run:
+            created = par2_manager.create_recovery_files_batch(
+                files, output_dir=metadata_dir
+            )
+
+        cmd = mock_run.call_args.args[0]
+        assert cmd[2] == f"-B{tmp_path.absolute()}"
+        assert cmd[-2:] == ["a.7z", "b.7z"]
+        assert created == [metadata_dir / "a.7z.par2"]
+
+    def test_verify_recovery_files_batch(self, par2_manager, tmp_path):
+        """Test that batch verification reports a result per PAR2 file."""
+        good, bad, broken = (tmp_path / f"{n}.7z.par2" for n in ("a", "b", "c"))
+        outcomes = {good: True, bad: False, broken: PAR2Error("timed out")}
+
+        def fake_verify(par2_file):
+            outcome = outcomes[par2_file]
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        with patch.object(
+            par2_manager, "verify_recovery_files", side_effect=fake_verify
+        ):
+            results = par2_manager.verify_recovery_files_batch([good, bad, broken])
+
+        assert results == {good: True, bad: False, broken: False}
+        assert par2_manager.verify_recovery_files_batch([]) == {}
+
+
 class TestProgressUtils:
     """Test progress tracking utilities."""
 
@@ -3,7 +3,9 @@
 
 """Tests for coldpack archive verification functionality."""
 
+import struct
 import tempfile
+import zlib
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -12,6 +14,7 @@ import pytest
 from coldpack.core.verifier import (
     ArchiveVerifier,
     VerificationError,
+    VerificationLayer,
     VerificationResult,
 )
 
@@ -62,6 +65,20 @@ class TestVerificationResult:
         assert str_repr == "[integrity_check] FAIL: Archive corrupted"
 
 
+class TestVerificationLayer:
+    """Test VerificationLayer flags."""
+
+    def test_from_names(self):
+        """Test translating layer names into a bitmask."""
+        mask = VerificationLayer.from_names({"sha256_hash", "par2_recovery"})
+
+        assert mask == VerificationLayer.SHA256_HASH | VerificationLayer.PAR2_RECOVERY
+
+    def test_from_names_ignores_unknown(self):
+        """Test that unknown layer names are ignored."""
+        assert VerificationLayer.from_names(["unknown_layer"]) == 0
+
+
 class TestArchiveVerifier:
     """Test ArchiveVerifier class."""
 
@@ -135,6 +152,63 @@ class TestArchiveVerifier:
             mock_hash.assert_called_once()
             mock_par2.assert_called_once()
 
+    @patch("coldpack.core.verifier.ArchiveVerifier.verify_7z_integrity")
+    @patch("coldpack.core.verifier.ArchiveVerifier.verify_hash_files")
+    @patch("coldpack.core.verifier.ArchiveVerifier.verify_par2_recovery")
+    def test_verify_complete_trust_par2_as_hash(
+        self, mock_par2, mock_hash, mock_7z, verifier, temp_archive
+    ):
+        """Test that a passing PAR2 layer covers the hash layers when trusted."""
+        mock_7z.return_value = VerificationResult("7z_integrity", True, "7z OK")
+        mock_par2.return_value = VerificationResult("par2_recovery", True, "PAR2 OK")
+
+        hash_files = {
+            "sha256": Path("test.sha256"),
+            "blake3": Path("test.blake3"),
+        }
+        results = verifier.verify_complete(
+            temp_archive,
+            hash_files=hash_files,
+            par2_file=Path("test.par2"),
+            trust_par2_as_hash=True,
+        )
+
+        mock_hash.assert_not_called()
+        assert [r.layer for r in results] == [
+            "7z_integrity",
+            "sha256",
+            "blake3",
+            "par2_recovery",
+        ]
+        assert all(r.success for r in results)
+        assert "covered by PAR2" in results[1].message
+
+    @patch("coldpack.core.verifier.ArchiveVerifier.verify_7z_integrity")
+    @patch("coldpack.core.verifier.ArchiveVerifier.verify_hash_files")
+    @patch("coldpack.core.verifier.ArchiveVerifier.verify_par2_recovery")
+    def test_verify_complete_trust_par2_as_hash_par2_failure(
+        self, mock_par2, mock_hash, mock_7z, verifier, temp_archive
+    ):
+        """Test that hash layers still run when trusted PAR2 verification fails."""
+        mock_7z.return_value = VerificationResult("7z_integrity", True, "7z OK")
+        mock_hash.return_value = [VerificationResult("sha256", True, "SHA256 OK")]
+        mock_par2.return_value = VerificationResult("par2_recovery", False, "bad")
+
+        results = verifier.verify_complete(
+            temp_archive,
+            hash_files={"sha256": Path("test.sha256")},
+            par2_file=Path("test.par2"),
+            trust_par2_as_hash=True,
+        )
+
+        mock_hash.assert_called_once()
+        mock_par2.assert_called_once()
+        assert [r.layer for r in results] == [
+            "7z_integrity",
+            "sha256",
+            "par2_recovery",
+        ]
+
     def test_verify_7z_integrity_nonexistent_file(self, verifier):
         """Test 7z integrity verification with non-existent file."""
         nonexistent_path = Path("/nonexistent/archive.7z")
@@ -232,6 +306,36 @@ class TestArchiveVerifier:
             assert results[0].layer == "blake3"
             assert results[0].success is False
 
+    def test_preload_hashes_uses_cache(self, verifier):
+        """Test that preloaded hash files are not re-read during verification."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            archive_path = Path(temp_dir) / "test.7z"
+            archive_path.write_bytes(b"dummy archive")
+
+            from coldpack.utils.hashing import compute_sha256_hash
+
+            sha256_file = Path(temp_dir) / "test.7z.sha256"
+            sha256_file.write_text(f"{compute_sha256_hash(archive_path)}  test.7z\n")
+            (Path(temp_dir) / "notes.txt").write_text("not a hash file")
+
+            verifier.preload_hashes(temp_dir)
+
+            with patch(
+                "coldpack.utils.hashing.HashVerifier.read_hash_file"
+            ) as mock_read:
+                results = verifier.verify_hash_files(
+                    archive_path, {"sha256": sha256_file}
+                )
+
+            mock_read.assert_not_called()
+            assert len(results) == 1
+            assert results[0].success is True
+
+    def test_preload_hashes_nonexistent_dir(self, verifier):
+        """Test preloading hashes from a non-existent directory."""
+        with pytest.raises(FileNotFoundError, match="Hash directory not found"):
+            verifier.preload_hashes(Path("/nonexistent/hashes"))
+
     def test_verify_par2_recovery_no_file(self, verifier, temp_archive):
         """Test PAR2 verification with no PAR2 file."""
         result = verifier.verify_par2_recovery(temp_archive, None)
@@ -336,20 +440,26 @@ class TestArchiveVerifier:
         assert result is False
 
     @patch("coldpack.utils.sevenzip.validate_7z_archive")
-    def test_verify_quick_success(self, mock_validate, verifier, temp_archive):
-        """Test successful quick verification."""
-        mock_validate.return_value = True
+    def test_verify_quick_success(self, mock_validate, verifier, tmp_path):
+        """Test successful quick verification checks headers only."""
+        next_header = b"\x01\x04\x06\x00"
+        start_header = struct.pack("<QQI", 5, len(next_header), zlib.crc32(next_header))
+        archive_path = tmp_path / "test.7z"
+        archive_path.write_bytes(
+            b"7z\xbc\xaf\x27\x1c\x00\x04"
+            + struct.pack("<I", zlib.crc32(start_header))
+            + start_header
+            + b"\x00" * 5
+            + next_header
+        )
 
-        result = verifier.verify_quick(temp_archive)
+        result = verifier.verify_quick(archive_path)
 
         assert result is True
-        mock_validate.assert_called_once_with(str(temp_archive))
-
-    @patch("coldpack.utils.sevenzip.validate_7z_archive")
-    def test_verify_quick_failure(self, mock_validate, verifier, temp_archive):
-        """Test failed quick verification."""
-        mock_validate.return_value = False
+        mock_validate.assert_not_called()
 
+    def test_verify_quick_failure(self, verifier, temp_archive):
+        """Test failed quick verification on a file without 7z headers."""
         result = verifier.verify_quick(temp_archive)
 
         assert result is False
@@ -406,6 +516,32 @@ class TestArchiveVerifier:
         assert hash_files_arg is not None
         assert par2_file_arg is not None
 
+    @patch("coldpack.core.verifier.ArchiveVerifier.verify_7z_integrity")
+    @patch("coldpack.core.verifier.ArchiveVerifier.verify_hash_files")
+    @patch("coldpack.core.verifier.ArchiveVerifier.verify_par2_recovery")
+    def test_verify_complete_with_skip_mask(
+        self, mock_par2, mock_hash, mock_7z, verifier, temp_archive
+    ):
+        """Test that skip_mask and skip_layers are combined."""
+        mock_hash.return_value = [VerificationResult("blake3", True, "OK")]
+
+        results = verifier._verify_complete_with_skip(
+            temp_archive,
+            hash_files={
+                "sha256": Path("test.sha256"),
+                "blake3": Path("test.blake3"),
+            },
+            par2_file=Path("test.par2"),
+            skip_layers={"sha256_hash"},
+            skip_mask=VerificationLayer.SEVENZ_INTEGRITY
+            | VerificationLayer.PAR2_RECOVERY,
+        )
+
+        mock_7z.assert_not_called()
+        mock_par2.assert_not_called()
+        mock_hash.assert_called_once_with(temp_archive, {"blake3": Path("test.blake3")})
+        assert [r.layer for r in results] == ["blake3"]
+
     def test_discover_hash_files_no_files(self, verifier, temp_archive):
         """Test hash file discovery with no hash files."""
         hash_files = verifier._discover_hash_files(temp_archive, set())
@@ -453,6 +589,12 @@ class TestArchiveVerifier:
 
             assert discovered_par2 == par2_file
 
+    def test_archive_stem(self, verifier):
+        """Test archive stem extraction for sidecar discovery."""
+        assert verifier._archive_stem(Path("test.7z")) == "test"
+        assert verifier._archive_stem(Path("test.tar.zst")) == "test"
+        assert verifier._archive_stem(Path("my.tar.backup.7z")) == "my.tar.backup"
+
     def test_detect_archive_format(self, verifier):
         """Test archive format detection."""
         # Test various formats